@@ -1,5 +1,15 @@
+import sys
 import asyncio
 from .src.dev import start
 
+# Optional faster event loop; libuv has no Windows backend here, so it is only used elsewhere
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 if __name__ == "__main__":
-    asyncio.run(start())
\ No newline at end of file
+    if uvloop is not None and sys.platform != "win32":
+        uvloop.run(start())
+    else:
+        asyncio.run(start())
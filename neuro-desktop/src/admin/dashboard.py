@@ -5,9 +5,16 @@ import json
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
 from datetime import datetime
+import copy
 import shutil
 import logging
 
+# libyaml's C loader when PyYAML was built with it; same safe subset, much faster
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 app = Flask(__name__)
 app.secret_key = 'neuro-os-admin-dashboard-secret-key'
 
@@ -36,13 +43,26 @@ class ConfigManager:
         # Create backup directory
         self.backup_dir = self.base_path / 'backups'
         self.backup_dir.mkdir(exist_ok=True)
+
+        # In-memory backup index, rescanned only when the directory mtime changes
+        self._backups_cache = None
+        self._backups_dir_mtime = 0
+
+        # Parsed configs keyed by path, reused while (st_mtime_ns, st_size) is unchanged
+        self._config_cache = {}
     
     def load_config(self, config_name):
-        """Load a configuration file"""
+        """Load a configuration file, parsing it again only when it changed on disk"""
         try:
             config_info = self.configs[config_name]
-            with open(config_info['path'], 'r') as f:
-                return yaml.safe_load(f), None
+            path = config_info['path']
+            stat = path.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._config_cache.get(path)
+            if cached is None or cached[0] != key:
+                cached = self._config_cache[path] = (key, yaml.load(path.read_bytes(), Loader=YamlLoader))
+            # Callers edit the returned dict before saving it, so hand out a copy
+            return copy.deepcopy(cached[1]), None
         except FileNotFoundError:
             return None, f"Config file not found: {config_info['path']}"
         except yaml.YAMLError as e:
@@ -61,6 +81,7 @@ class ConfigManager:
             # Save new config
             with open(config_info['path'], 'w') as f:
                 yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            self._config_cache.pop(config_info['path'], None)
             
             logger.info(f"Saved config: {config_name}")
             return True, None
@@ -79,9 +100,45 @@ class ConfigManager:
                 backup_path = self.backup_dir / backup_filename
                 shutil.copy2(config_info['path'], backup_path)
                 logger.info(f"Created backup: {backup_path}")
+
+                # Keep the cached index in sync instead of forcing a rescan
+                if self._backups_cache is not None:
+                    self._backups_cache = [
+                        b for b in self._backups_cache if b['filename'] != backup_filename
+                    ]
+                    self._backups_cache.insert(0, self._backup_entry(backup_path))
+                    self._backups_dir_mtime = self.backup_dir.stat().st_mtime_ns
         except Exception as e:
             logger.error(f"Failed to create backup for {config_name}: {str(e)}")
     
+    def _backup_entry(self, backup_file):
+        """Build the listing entry for a single backup file"""
+        stat = backup_file.stat()
+        return {
+            'filename': backup_file.name,
+            'path': str(backup_file),
+            'size': stat.st_size,
+            'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+        }
+    
+    def list_backups(self):
+        """List backup files, newest first, reusing the cached index when unchanged"""
+        if not self.backup_dir.exists():
+            return []
+        
+        mtime = self.backup_dir.stat().st_mtime_ns
+        if self._backups_cache is not None and mtime == self._backups_dir_mtime:
+            return self._backups_cache
+        
+        backups = [self._backup_entry(f) for f in self.backup_dir.glob('*.yaml')]
+        
+        # Sort by creation time, newest first
+        backups.sort(key=lambda x: x['created'], reverse=True)
+        self._backups_cache = backups
+        self._backups_dir_mtime = mtime
+        return backups
+    
     def get_all_configs(self):
         """Load all configuration files"""
         configs = {}
@@ -209,7 +266,7 @@ def save_config_form(config_name):
         
         # Parse the YAML
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.load(yaml_content, Loader=YamlLoader)
         except yaml.YAMLError as e:
             flash(f"YAML parsing error: {str(e)}", 'error')
             return redirect(url_for('view_config', config_name=config_name))
@@ -289,21 +346,7 @@ def sync_tokens():
 def list_backups():
     """List all available backup files"""
     try:
-        backups = []
-        if config_manager.backup_dir.exists():
-            for backup_file in config_manager.backup_dir.glob('*.yaml'):
-                stat = backup_file.stat()
-                backups.append({
-                    'filename': backup_file.name,
-                    'path': str(backup_file),
-                    'size': stat.st_size,
-                    'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                })
-        
-        # Sort by creation time, newest first
-        backups.sort(key=lambda x: x['created'], reverse=True)
-        return jsonify(backups)
+        return jsonify(config_manager.list_backups())
     
     except Exception as e:
         logger.error(f"Error listing backups: {str(e)}")
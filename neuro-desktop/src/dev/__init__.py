@@ -9,9 +9,11 @@ from nakuritycore.utils.config import get_config_loader
 
 # Load configuration
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-config = get_config_loader( # Load configuration
+dev_config = get_config_loader( # Load configuration
     PROJECT_ROOT / "src" / "dev" / "config.yaml"
-).config.get("debug", {})
+).config
+config = dev_config.get("debug", {})
+connection_config = dev_config.get("connection", {})
 
 # Set log path from config or default
 log_config = config.get("logging", {})
@@ -30,11 +32,14 @@ logging_config = LoggingConfig(
 )
 logger = Logger("neuro-desktop-controller", logging_config)
 
-from nakuritycore.utils import Tracer
+from .utils.tracer import Tracer
 from nakuritycore.data.config import TracerConfig
 
 tracer_config = config.get("trace", {})
+# Read once at startup; when off the tracer is never installed, so traced code pays nothing
+TRACE_ENABLED = bool(config.get("enabled", False) and tracer_config.get("enabled", False))
 tracer_config = TracerConfig(
+    project_root=PROJECT_ROOT,
     include_paths=tracer_config.get("include_paths", ["neuro-desktop", "windows-api"]),
     exclude_functions=set(tracer_config.get("exclude_functions", ["write_log", "trace"])),
     events=set(tracer_config.get("events", ["call", "return", "exception"])),
@@ -44,6 +49,9 @@ tracer = Tracer(tracer_config)
 async def start():
     taskslist = [] # Tasks list
 
+    if TRACE_ENABLED:
+        tracer.install()
+
     WindowsAPIServer = getattr(importlib.import_module("windows-api"), "WindowsAPIServer")
     taskslist.append(asyncio.create_task( # Launch Windows API server
         WindowsAPIServer( # Windows API
@@ -63,15 +71,19 @@ async def start():
     taskslist.append(asyncio.create_task( # Launch client
         NeuroClient.start( # give neuro client windows-api's uri
             f"ws://{windows_api_config.get('host', '127.0.0.1')}:{windows_api_config.get('port', 8765)}",
-            f"ws://{neuro_desktop_config.get('host', '127.0.0.1')}:{neuro_desktop_config.get('port', 8766)}"
+            f"ws://{neuro_desktop_config.get('host', '127.0.0.1')}:{neuro_desktop_config.get('port', 8766)}",
+            retry=connection_config.get("retry", {})
         )
     ))
 
     try:
-        asyncio.gather(*taskslist)
+        # Both services were scheduled above and run side by side; wait on them together
+        await asyncio.gather(*taskslist)
     except KeyboardInterrupt:
         print("Server stopped.")
     finally:
+        if TRACE_ENABLED:
+            tracer.uninstall()
         print("[SHUTDOWN] Cleanup complete")
 
 __all__ = ["start"]
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+Static registry of Neuro action definitions
+Every module here exposes schema() returning a neuro_api Action
+"""
+from . import (
+    click,
+    dragrel,
+    dragto,
+    get_more_text,
+    get_more_windows,
+    hotkey,
+    keydown,
+    keyup,
+    move,
+    press,
+    refresh_context,
+    screenshot,
+)
+
+ACTION_MODULES = (
+    click,
+    dragrel,
+    dragto,
+    get_more_text,
+    get_more_windows,
+    hotkey,
+    keydown,
+    keyup,
+    move,
+    press,
+    refresh_context,
+    screenshot,
+)
+
+__all__ = ["ACTION_MODULES"]
@@ -7,7 +7,7 @@ from neuro_api.command import Action
 def schema():
     return Action(
         "get_more_windows",
-        "Request complete list of all visible windows. Use this when the context shows '... and X more windows'. Parameters: offset (int, skip N windows), limit (int, max 1-50, default 20), include_minimized (bool, default false).",
+        "Request complete list of all visible windows. Use this when the context shows '... and X more windows'. Parameters: offset (int, skip N windows), limit (int, max 1-50, default 20), include_minimized (bool, default false), format (string: text/json, default text).",
         {
             "type": "object",
             "properties": {
@@ -22,6 +22,10 @@ def schema():
                 },
                 "include_minimized": {
                     "type": "boolean"
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["text", "json"]
                 }
             },
             "required": []
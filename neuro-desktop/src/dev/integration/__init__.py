@@ -1,17 +1,20 @@
 # todo: make this export and initialoze the action schema for the neuro-client
 import os
-import importlib
 from pathlib import Path
 
 from neuro_api.command import Action
-import importlib.util
 
 ACTIONS_DIR = Path(__file__).parent / "Actions"
 
-def load_actions():
-  # Load all Action definitions dynamically
-  actions = []
-  for file in os.listdir(ACTIONS_DIR):
+# Set NEURO_DYNAMIC_ACTIONS=1 while developing to pick up new Actions/*.py files without registering them
+DYNAMIC_ACTIONS = os.environ.get("NEURO_DYNAMIC_ACTIONS", "") not in ("", "0")
+
+def _discover_action_modules():
+  # Load all Action modules dynamically from the Actions directory (dev only)
+  import importlib.util
+
+  modules = []
+  for file in sorted(os.listdir(ACTIONS_DIR)):
       if not file.endswith(".py") or file.startswith("__"):
           continue
 
@@ -19,7 +22,24 @@ def load_actions():
       spec = importlib.util.spec_from_file_location(file[:-3], file_path)
       module = importlib.util.module_from_spec(spec)
       spec.loader.exec_module(module)
+      modules.append(module)
+
+  return modules
 
+_loaded_actions = None  # Actions built from the static registry, reused on every reconnect
+
+def load_actions():
+  # Load all Action definitions from the static registry in Actions/__init__.py
+  global _loaded_actions
+  if DYNAMIC_ACTIONS:
+      modules = _discover_action_modules()
+  elif _loaded_actions is not None:
+      return list(_loaded_actions)
+  else:
+      from .Actions import ACTION_MODULES as modules
+
+  actions = []
+  for module in modules:
       if hasattr(module, "schema"):
           act = module.schema()
           # Validate action is correctly formatted
@@ -27,8 +47,10 @@ def load_actions():
               actions.append(act)
               print(f"[ACTION] Loaded: {act.name}")
           else:
-              print(f"[ACTION] Error: {file} did not return a valid Action")
+              print(f"[ACTION] Error: {module.__name__} did not return a valid Action")
 
+  if not DYNAMIC_ACTIONS:
+      _loaded_actions = tuple(actions)
   return actions
 
 from .client import NeuroClient
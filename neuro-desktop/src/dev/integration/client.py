@@ -1,6 +1,12 @@
-import json
+import os
+import time
+import random
 import asyncio
+import logging
+import functools
+import orjson
 import websockets
+from websockets.protocol import State
 
 from neuro_api.api import AbstractNeuroAPI, NeuroAction
 from neuro_api.command import *
@@ -12,8 +18,58 @@ try:
 except Exception:
     RegionalizationCore = None
 
+logger = logging.getLogger(__name__)
+_DEBUG = os.environ.get("NEURO_DEBUG") == "1"  # full tracebacks for logged failures
+
+def _log_failure(msg: str, exc: BaseException):
+    """Log a handled failure; one line unless NEURO_DEBUG=1, so a flapping backend doesn't format a traceback per retry."""
+    if _DEBUG:
+        logger.error(msg, exc_info=exc)
+    else:
+        logger.error("%s: %s: %s", msg, type(exc).__name__, exc)
+
 # -------- Neurosama / Neuro-API integration --------
 
+# Row templates for paginated context (applied with % to the cached row tuples)
+_OCR_FMT = '  - [%s] "%s" at (%d, %d)'
+_WINDOW_FMT = "  %d. %s%s\n     Position: (%d, %d), Size: %dx%d, Click center: (%d, %d)"
+
+@functools.lru_cache(maxsize=1)
+def _build_primer(action_names: tuple) -> str:
+    """One-time capability primer for Neuro; identical on every reconnect for the same action set."""
+    return (
+        f"Neuro-OS Windows integration is active. I can control the Windows UI via actions: "
+        f"{', '.join(action_names)}. "
+        f"I will periodically send summaries of the current screen, focused window, and available UI targets."
+    )
+
+@functools.lru_cache(maxsize=8)
+def _encode_context(game: str, message: str, silent: bool) -> str:
+    """Serialized context frame; a resend of the same message (debounce flush, keep-alive) reuses it."""
+    return context_command(game, message, silent).decode("utf-8")
+
+# Field names for the window row tuples cached by _refresh_context_cache (used for format=json)
+_WINDOW_KEYS = ("title", "x", "y", "w", "h", "cx", "cy", "focused", "app")
+
+async def _retry(coro_factory, name, max_attempts=10, initial_delay=5, max_delay=60, backoff_multiplier=1.5):
+    """Await coro_factory() until it succeeds, backing off exponentially (capped, with jitter) between tries."""
+    for attempt in range(max_attempts):
+        try:
+            return await coro_factory()
+        except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+            if attempt + 1 >= max_attempts:
+                raise
+            delay = min(max_delay, initial_delay * backoff_multiplier ** attempt) + random.uniform(0, 0.5)
+            print(f"[NEURO] {name} failed ({e}), retrying in {delay:.1f}s ({attempt + 1}/{max_attempts})")
+            await asyncio.sleep(delay)
+
+# Both links are local and carry small JSON frames: no permessage-deflate, bounded frames and buffers
+_LOCAL_WS_OPTIONS = {
+    "compression": None, "max_size": 2**20, "write_limit": 2**18,
+    "open_timeout": 3, "close_timeout": 1,  # fail fast so retry logic runs instead of hanging
+}
+WINDOWS_RESPONSE_TIMEOUT = 10  # seconds to wait for the Windows API to answer one action
+
 class NeuroClient(AbstractNeuroAPI):
     """
     Subclassing the SDK’s WebSocket client, handling incoming action requests from Neuro,
@@ -26,11 +82,69 @@ class NeuroClient(AbstractNeuroAPI):
         self._reg = RegionalizationCore() if RegionalizationCore else None
         self.windows_api_uri = "ws://127.0.0.1:8765"
         self.auth_token = "super-secret-token"
-        self._action_in_progress = False
+        self._idle = asyncio.Event()  # cleared while Neuro waits on an action result
+        self._idle.set()
+        self._win_ws = None  # Persistent connection to the Windows API, opened on first action
+        self._win_lock = asyncio.Lock()  # One request/response in flight on _win_ws at a time
+        self._out_q = asyncio.Queue(maxsize=256)  # Outbound frames to Neuro, drained by _writer_loop
+        self._writer_task = None
+        self._last_ctx_sent_at = 0.0  # monotonic time of the last context send (debounce)
+        self._pending_ctx = None  # newest context held back by the debounce window
+        self._pending_ctx_task = None  # trailing-edge send, kept so it isn't collected and can be cancelled
+        self._cached_context = None  # paginated views of the last state, rebuilt once per state change
+        self._envelope_prefix = {}  # action name -> b'{"token":...,"action":...,' (token is fixed before the first action)
         super().__init__(self.name)
 
     async def write_to_websocket(self, data: str) -> None:
-        await self.websocket.send(data)
+        # Queue the frame; _writer_loop sends it so callers don't wait on socket drain
+        self._ensure_writer()
+        await self._out_q.put(data)
+        self._ensure_writer()  # the writer may have stopped while put() waited for room
+
+    def _ensure_writer(self):
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def send_context(self, message: str, silent: bool = True) -> None:
+        # Same frame as the SDK builds, but encoded once per distinct message
+        await self.write_to_websocket(_encode_context(self.game_title, message, silent))
+
+    async def _writer_loop(self):
+        """Drain the outbound queue, sending everything that is ready back to back."""
+        queue = self._out_q
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < 32 and not queue.empty():
+                    batch.append(queue.get_nowait())
+                send = self.websocket.send  # per batch, so a replaced websocket is picked up
+                try:
+                    for data in batch:
+                        await send(data)
+                except websockets.exceptions.ConnectionClosed:
+                    # Drop what is queued so writers blocked on a full queue are released
+                    dropped = len(batch) + self._discard_outbound()
+                    print(f"[NEURO] Connection closed, dropped {dropped} outbound message(s)")
+                    return
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        except Exception as e:
+            _log_failure("[NEURO] Outbound writer stopped", e)
+        finally:
+            # The next write_to_websocket() starts a new writer
+            if self._writer_task is asyncio.current_task():
+                self._writer_task = None
+
+    def _discard_outbound(self) -> int:
+        """Empty the outbound queue; returns how many frames were discarded."""
+        queue = self._out_q
+        count = 0
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+            count += 1
+        return count
 
     async def read_from_websocket(self) -> str:
         return await self.websocket.recv()
@@ -46,18 +160,14 @@ class NeuroClient(AbstractNeuroAPI):
 
         # Send a one-time capability/context primer so Neuro understands this game
         try:
-            action_names = [a.name for a in load_actions()]
-            primer = (
-                f"Neuro-OS Windows integration is active. I can control the Windows UI via actions: "
-                f"{', '.join(action_names)}. "
-                f"I will periodically send summaries of the current screen, focused window, and available UI targets."
-            )
+            primer = _build_primer(tuple(a.name for a in actions))
             await self.send_context(primer, silent=True)
         except Exception:
             pass
 
-        # Start periodic context publishing to the Neuro backend (rich summaries)
+        # Start the regionalization update loop and publish its changes to the Neuro backend (rich summaries)
         if self._reg and self._context_task is None:
+            await self._reg.start()
             self._context_task = asyncio.create_task(self._publish_context_loop())
 
     async def handle_action(self, action: NeuroAction):
@@ -69,7 +179,7 @@ class NeuroClient(AbstractNeuroAPI):
         name = action.name
         # Safely parse params
         try:
-            params = json.loads(action.data) if action.data else {}
+            params = orjson.loads(action.data) if action.data else {}
         except Exception:
             params = {}
         print(f"[NEURO] Received action: {name}, params: {params}")
@@ -79,8 +189,20 @@ class NeuroClient(AbstractNeuroAPI):
             await self.send_action_result(action.id_, True, "context_update received by neuro-os")
             return
 
+        # Pagination over the cached context is answered locally, not by the Windows API
+        if name in ("get_more_text", "get_more_windows"):
+            try:
+                if name == "get_more_text":
+                    message = self._get_more_text(params)
+                else:
+                    message = self._get_more_windows(params)
+                await self.send_action_result(action.id_, True, message)
+            except Exception as e:
+                await self.send_action_result(action.id_, False, f"Error: {str(e)}")
+            return
+
         # Execute the Windows action and wait for actual result
-        self._action_in_progress = True
+        self._idle.clear()
         try:
             success, message = await self._execute_windows_action(name, params)
             await self.send_action_result(action.id_, success, message)
@@ -88,7 +210,7 @@ class NeuroClient(AbstractNeuroAPI):
             await self.send_action_result(action.id_, False, f"Error: {str(e)}")
         finally:
             # We are no longer blocking Neuro; allow context publishing again
-            self._action_in_progress = False
+            self._idle.set()
 
     async def on_connect(self):
         print("[NEURO] Connected to Neuro API")
@@ -108,101 +230,288 @@ class NeuroClient(AbstractNeuroAPI):
                 except Exception:
                     pass
 
-            async with websockets.connect(self.windows_api_uri) as ws:
-                msg = {"token": self.auth_token, "action": name, **params}
-                await ws.send(json.dumps(msg))
-                resp_text = await ws.recv()
-                
-                # Parse response
-                try:
-                    resp = json.loads(resp_text)
-                    if resp.get("status") == "ok":
-                        result = resp.get("result", {})
-                        return True, f"Action '{name}' completed: {json.dumps(result)}"
-                    elif resp.get("status") == "error":
-                        error = resp.get("error", {})
-                        error_msg = error.get("message", "Unknown error")
-                        return False, f"Action '{name}' failed: {error_msg}"
-                    else:
-                        return True, f"Action '{name}' completed with unknown status"
-                except json.JSONDecodeError:
-                    return True, f"Action '{name}' completed (response: {resp_text[:100]})"
-                    
+            resp_text = await self._windows_request(self._encode_windows_action(name, params))
+
+            # Parse response
+            try:
+                resp = orjson.loads(resp_text)
+                if resp.get("status") == "ok":
+                    result = resp.get("result", {})
+                    return True, f"Action '{name}' completed: {orjson.dumps(result).decode()}"
+                elif resp.get("status") == "error":
+                    error = resp.get("error", {})
+                    error_msg = error.get("message", "Unknown error")
+                    return False, f"Action '{name}' failed: {error_msg}"
+                else:
+                    return True, f"Action '{name}' completed with unknown status"
+            except orjson.JSONDecodeError:
+                return True, f"Action '{name}' completed (response: {resp_text[:100]})"
+
         except Exception as e:
             print(f"[WINERR] {e}")
             return False, f"Failed to execute action: {str(e)}"
 
+    async def _ensure_win_ws(self):
+        """Open the Windows API connection if there is none yet or it has closed."""
+        if self._win_ws is None or self._win_ws.state is not State.OPEN:
+            self._win_ws = await websockets.connect(
+                self.windows_api_uri,
+                ping_interval=20,  # keepalive so a dead Windows API is noticed between actions
+                **_LOCAL_WS_OPTIONS,
+            )
+        return self._win_ws
+
+    def _encode_windows_action(self, name: str, params: dict) -> bytes:
+        """Encode {"token", "action", **params} reusing the pre-serialized token/action prefix."""
+        prefix = self._envelope_prefix.get(name)
+        if prefix is None:
+            prefix = orjson.dumps({"token": self.auth_token, "action": name})[:-1] + b","
+            self._envelope_prefix[name] = prefix
+        if not params:
+            return prefix[:-1] + b"}"
+        return prefix + orjson.dumps(params)[1:]  # splice params in after the prefix's trailing comma
+
+    async def _windows_request(self, data: bytes) -> str:
+        """Send one request over the persistent Windows API connection and return its reply."""
+        async with self._win_lock:
+            try:
+                ws = await self._ensure_win_ws()
+                await ws.send(data, text=True)
+                return await self._windows_recv(ws)
+            except websockets.exceptions.ConnectionClosed:
+                # Server restarted or dropped us; reconnect once and resend
+                self._win_ws = None
+                ws = await self._ensure_win_ws()
+                await ws.send(data, text=True)
+                return await self._windows_recv(ws)
+
+    async def _windows_recv(self, ws) -> str:
+        """Wait for the Windows API reply; a silent server drops the connection instead of hanging."""
+        try:
+            return await asyncio.wait_for(ws.recv(), timeout=WINDOWS_RESPONSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            # A late reply would be read as the answer to the next request, so start over
+            self._win_ws = None
+            await ws.close()
+            raise asyncio.TimeoutError(f"Windows API did not answer within {WINDOWS_RESPONSE_TIMEOUT}s") from None
+
+    async def close(self):
+        """Stop background work and close the Windows API connection."""
+        if self._context_task is not None:
+            self._context_task.cancel()
+            self._context_task = None
+            await self._reg.stop()
+        if self._pending_ctx_task is not None:
+            self._pending_ctx_task.cancel()
+            self._pending_ctx_task = None
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._win_ws is not None:
+            await self._win_ws.close()
+            self._win_ws = None
+
+    def _refresh_context_cache(self):
+        """Flatten the current OCR elements and windows into per-type row tuples in one pass."""
+        state = self._reg.get_current_state() if self._reg else None
+        ocr_by_type = {}
+        ocr_all = []
+        for e in (self._reg.get_ocr_elements() if self._reg else ()):
+            row = (e.element_type, e.text, e.center_x, e.center_y)
+            ocr_all.append(row)
+            ocr_by_type.setdefault(e.element_type, []).append(row)
+        ocr_by_type["all"] = ocr_all
+
+        windows = []
+        for r in (state.all_regions if state else ()):
+            if r.region_type.value != "window":
+                continue
+            b = r.bounds
+            title = r.title[:60] if r.title else r.title
+            focused = bool(r.metadata.get("focused", False)) if r.metadata else False
+            windows.append((
+                title, b.x, b.y, b.width, b.height, b.x + b.width // 2, b.y + b.height // 2, focused, r.application
+            ))
+
+        self._cached_context = {"ocr_by_type": ocr_by_type, "windows": windows, "timestamp": time.monotonic()}
+        return self._cached_context
+
+    CONTEXT_CACHE_MAX_AGE = 10.0  # seconds before pagination rebuilds the cache itself
+
+    def _get_context_cache(self):
+        """Return the pagination cache, rebuilding it if it is missing or stale."""
+        cache = self._cached_context
+        if cache is None or time.monotonic() - cache["timestamp"] > self.CONTEXT_CACHE_MAX_AGE:
+            cache = self._refresh_context_cache()
+        return cache
+
+    # get_more_text filter names -> OCRElement.element_type
+    _TEXT_FILTERS = {"all": "all", "buttons": "button", "links": "link", "text": "text", "inputs": "input"}
+
+    def _get_more_text(self, params: dict) -> str:
+        """Return one page of detected text items, optionally filtered by element type."""
+        cache = self._get_context_cache()
+        offset = max(0, int(params.get("offset", 0)))
+        limit = min(100, max(1, int(params.get("limit", 50))))
+        filter_type = params.get("filter_type", "all")
+        rows = cache["ocr_by_type"].get(self._TEXT_FILTERS.get(filter_type, filter_type), ())
+
+        total = len(rows)
+        page = rows[offset:offset + limit]
+        if not page:
+            return f"No text items at offset {offset} (filter: {filter_type}, total: {total})"
+
+        end = offset + len(page)
+        lines = [f"Detected text items {offset + 1}-{end} of {total} (filter: {filter_type}):"]
+        lines += [_OCR_FMT % row for row in page]
+        if end < total:
+            lines.append(f"  ... and {total - end} more (use offset={end})")
+        return "\n".join(lines)
+
+    def _get_more_windows(self, params: dict) -> str:
+        """Return one page of the visible windows list."""
+        cache = self._get_context_cache()
+        offset = max(0, int(params.get("offset", 0)))
+        limit = min(50, max(1, int(params.get("limit", 20))))
+        rows = cache["windows"]
+
+        total = len(rows)
+        page = rows[offset:offset + limit]
+
+        # Structured page serialized in one orjson call instead of formatting every row
+        if params.get("format") == "json":
+            return orjson.dumps({
+                "total": total,
+                "offset": offset,
+                "windows": [dict(zip(_WINDOW_KEYS, row)) for row in page],
+            }).decode()
+
+        if not page:
+            return f"No windows at offset {offset} (total: {total})"
+
+        end = offset + len(page)
+        lines = [f"Visible Windows {offset + 1}-{end} of {total}:"]
+        lines += [
+            _WINDOW_FMT % (i, title, " [FOCUSED]" if focused else "", x, y, width, height, center_x, center_y)
+            for i, (title, x, y, width, height, center_x, center_y, focused, _) in enumerate(page, offset + 1)
+        ]
+        if end < total:
+            lines.append(f"  ... and {total - end} more windows (use offset={end})")
+        return "\n".join(lines)
+
     async def _publish_context_once(self):
         if not self._reg:
-            print("[CONTEXT] Regionalization not available")
+            logger.warning("[CONTEXT] Regionalization not available")
             return
         # Do not send context while Neuro is waiting for an action result
-        if getattr(self, "_action_in_progress", False):
-            print("[CONTEXT] Skipping - action in progress")
+        if not self._idle.is_set():
+            logger.debug("[CONTEXT] Skipping - action in progress")
             return
         try:
-            print("[CONTEXT] Updating regionalization state...")
+            logger.debug("[CONTEXT] Updating regionalization state...")
             await self._reg.force_update()
             state = self._reg.get_current_state()
             if not state:
-                print("[CONTEXT] No state available")
+                logger.debug("[CONTEXT] No state available")
                 return
             context_msg = self._reg.get_context_message()
-            print(f"[CONTEXT] Sending context: {context_msg[:200]}...")
+            if logger.isEnabledFor(logging.DEBUG):  # skip building the preview unless it is logged
+                logger.debug("[CONTEXT] Sending context: %s...", context_msg[:200])
             # Use SDK "context" command (proper protocol) so backend accepts it
             await self.send_context(context_msg, silent=True)
-            print("[CONTEXT] Context sent successfully")
+            logger.debug("[CONTEXT] Context sent successfully")
         except Exception as e:
-            print(f"[CONTEXT_ERR] Failed to publish context: {e}")
-            import traceback
-            traceback.print_exc()
+            _log_failure("[CONTEXT_ERR] Failed to publish context", e)
+
+    CONTEXT_MIN_INTERVAL = 1.0  # seconds between context sends; bursts inside it collapse into one trailing send
+
+    async def _send_context_debounced(self, context_msg: str) -> bool:
+        """Send now if the debounce window is open, otherwise keep only the newest message for its end."""
+        remaining = self._last_ctx_sent_at + self.CONTEXT_MIN_INTERVAL - time.monotonic()
+        if remaining <= 0:
+            self._pending_ctx = None
+            self._last_ctx_sent_at = time.monotonic()
+            await self.send_context(context_msg, silent=True)
+            return True
+        self._pending_ctx = context_msg
+        if self._pending_ctx_task is None:
+            self._pending_ctx_task = asyncio.create_task(self._flush_pending_context(remaining))
+        return False
+
+    async def _flush_pending_context(self, delay: float):
+        """Trailing edge of the debounce: after delay, send the newest context that was held back."""
+        try:
+            await asyncio.sleep(delay)
+            await self._idle.wait()
+            context_msg, self._pending_ctx = self._pending_ctx, None
+            if context_msg is None:
+                return  # a leading-edge send went out meanwhile
+            self._last_ctx_sent_at = time.monotonic()
+            await self.send_context(context_msg, silent=True)
+        except Exception as e:
+            _log_failure("[CONTEXT_ERR] Failed to publish context", e)
+        finally:
+            if self._pending_ctx_task is asyncio.current_task():
+                self._pending_ctx_task = None
+
+    CONTEXT_KEEPALIVE = 5.0  # seconds without a state change before the message is rebuilt and compared anyway
 
     async def _publish_context_loop(self):
-        print("[CONTEXT] Starting context publishing loop (2s check, send on change)")
-        last_context_msg = None
+        logger.info("[CONTEXT] Starting context publishing loop (send on state change, %gs keep-alive)", self.CONTEXT_KEEPALIVE)
+        last_context_hash = None  # hash of the last sent message; the string itself is not kept
+        state_changed = self._reg.state_changed
         
         while True:
-            # Check state more frequently but only send if changed
-            if not self._reg:
-                await asyncio.sleep(5)
-                continue
-                
-            if getattr(self, "_action_in_progress", False):
-                await asyncio.sleep(2)
-                continue
+            # Wake when the regionalization core reports a new state; the timeout is a keep-alive
+            # for the live parts of the message (mouse position, on-screen text) it does not track
+            try:
+                await asyncio.wait_for(state_changed.wait(), timeout=self.CONTEXT_KEEPALIVE)
+            except asyncio.TimeoutError:
+                pass
+            changed = state_changed.is_set()
+            state_changed.clear()
+            
+            # Hold the update until Neuro is no longer waiting on an action result
+            await self._idle.wait()
                 
             try:
-                await self._reg.force_update()
                 state = self._reg.get_current_state()
                 if not state:
-                    await asyncio.sleep(2)
                     continue
                     
+                # Pagination reads from this cache, so it is rebuilt only when the state moved
+                if changed or self._cached_context is None:
+                    self._refresh_context_cache()
+                    
                 context_msg = self._reg.get_context_message()
                 
                 # Only send if context actually changed
-                if context_msg != last_context_msg:
-                    print(f"[CONTEXT] State changed, sending update")
-                    await self.send_context(context_msg, silent=True)
-                    last_context_msg = context_msg
-                    print("[CONTEXT] Context sent successfully")
+                context_hash = hash(context_msg)
+                if context_hash != last_context_hash:
+                    logger.debug("[CONTEXT] State changed, sending update")
+                    sent = await self._send_context_debounced(context_msg)
+                    last_context_hash = context_hash
+                    logger.debug("[CONTEXT] Context sent successfully" if sent else "[CONTEXT] Context deferred (debounce)")
                 else:
-                    print("[CONTEXT] No change, skipping update")
+                    logger.debug("[CONTEXT] No change, skipping update")
                     
             except Exception as e:
-                print(f"[CONTEXT_ERR] Failed to publish context: {e}")
-                import traceback
-                traceback.print_exc()
-                
-            await asyncio.sleep(2)  # Check every 2 seconds
+                _log_failure("[CONTEXT_ERR] Failed to publish context", e)
     
     @staticmethod
     async def start(
         windows_api_uri = "ws://127.0.0.1:8765",
         neuro_backend_uri = "ws://127.0.0.1:8000",
-        auth_token = "super-secret-token"
+        auth_token = "super-secret-token",
+        retry = None
     ):
-        async with websockets.connect(neuro_backend_uri) as websocket:
+        # retry: connection.retry settings from config.yaml (max_attempts, initial_delay, max_delay, backoff_multiplier)
+        websocket = await _retry(
+            lambda: websockets.connect(neuro_backend_uri, **_LOCAL_WS_OPTIONS),
+            "Connecting to Neuro backend",
+            **(retry or {})
+        )
+        async with websocket:
             client = NeuroClient(websocket)
 
             # Set up client
@@ -210,9 +519,14 @@ class NeuroClient(AbstractNeuroAPI):
             client.auth_token = auth_token
             await client.initialize()
 
-            # Read messages in a loop
-            while True:
-                try:
-                    await client.read_message()
-                except websockets.exceptions.ConnectionClosed:
-                    break
+            # Read messages in a loop (bound to locals to skip per-frame attribute lookups)
+            read_message = client.read_message
+            connection_closed = websockets.exceptions.ConnectionClosed
+            try:
+                while True:
+                    try:
+                        await read_message()
+                    except connection_closed:
+                        break
+            finally:
+                await client.close()
@@ -5,6 +5,10 @@ Detects and manages screen regions, provides context to Neuro
 
 import asyncio
 import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Set
 from datetime import datetime
 
@@ -23,6 +27,13 @@ except ImportError as e:
     win32api = None
     pyautogui = None
 
+# Optional: grabs raw BGRA frames without going through PIL
+try:
+    import mss
+    import mss.tools
+except ImportError:
+    mss = None
+
 from pathlib import Path
 
 try:
@@ -31,11 +42,21 @@ except ImportError:
     OCRDetector = None
 
 try:
-    from .vision_api_client import VisionAPIClient
+    from .vision_api_client import VisionAPIClient, encode_image
+except ImportError:
+    VisionAPIClient = encode_image = None
+
+try:
+    from .win_events import WinEventWatcher
+except ImportError:
+    WinEventWatcher = None
+
+try:
+    from .win_process import query_process_image, query_window
 except ImportError:
-    VisionAPIClient = None
+    query_process_image = query_window = None
 
-from ..types.neuro_types import (
+from ....types.neuro_types import (
     ScreenRegion, RegionType, BoundingBox, Coordinates,
     ContextData, ContextType, SystemState, NeuroAction,
     PluginRegistry, PluginType, Priority, NeuroMessageBuilder
@@ -43,6 +64,10 @@ from ..types.neuro_types import (
 
 logger = logging.getLogger(__name__)
 
+def _collect_hwnd(hwnd, hwnds):
+    hwnds.append(hwnd)
+    return True
+
 class WindowDetector:
     """Detects windows and basic UI regions using Windows API"""
     
@@ -50,27 +75,115 @@ class WindowDetector:
         self.cached_windows = {}
         self.last_update = None
         self.available = win32gui is not None
+        # Per-window (rect, title, pid, app_name); only trusted while window hooks report changes
+        self.cache_windows = False
+        self._hwnd_cache: Dict[int, tuple] = {}
+        self._hwnd_lock = threading.Lock()  # invalidate() runs on the hook thread
+        self._processes: Dict[int, tuple] = {}  # pid -> (create time, name)
+        # WinAPI/psutil calls block; they run here instead of on the event loop
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wnd")
+    
+    async def _run(self, fn):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn)
+    
+    def invalidate(self, hwnd: Optional[int] = None):
+        """Forget cached info for a window (or all windows) reported changed by the OS"""
+        with self._hwnd_lock:
+            if hwnd is None:
+                self._hwnd_cache.clear()
+            else:
+                self._hwnd_cache.pop(hwnd, None)
+    
+    def _process_name(self, pid: int) -> str:
+        """Process name for a pid, looked up once per process"""
+        cached = self._processes.get(pid)
+        # Entries are keyed by create time too, so a reused pid is not mistaken for the old process
+        entry = query_process_image(pid, cached) if query_process_image else None
+        if entry is None:
+            # Fall back to psutil (non-Windows, or processes OpenProcess is denied for)
+            try:
+                process = psutil.Process(pid)
+                create_time = process.create_time()
+                if cached is not None and cached[0] == create_time:
+                    entry = cached
+                else:
+                    entry = (create_time, process.name())
+            except Exception:
+                with self._hwnd_lock:
+                    self._processes.pop(pid, None)
+                return "Unknown"
+        if entry is not cached:
+            with self._hwnd_lock:
+                self._processes[pid] = entry
+        return entry[1]
+    
+    def _window_info(self, hwnd: int, listed_only: bool = False) -> Optional[tuple]:
+        """(rect, title, pid, app_name) for a window, from the cache when hooks keep it fresh
+        
+        With listed_only, windows detect_windows drops (tiny or untitled) skip the process
+        lookup and come back with pid and app_name set to None.
+        """
+        if self.cache_windows:
+            info = self._hwnd_cache.get(hwnd)
+            if info is not None and (listed_only or info[3] is not None):
+                return info
+        
+        if query_window:
+            # Rect and title from one GetWindowInfo + InternalGetWindowText
+            queried = query_window(hwnd)
+            if queried is None:
+                return None
+            rect, title = queried
+        else:
+            # Get window rect with error handling
+            try:
+                rect = win32gui.GetWindowRect(hwnd)
+            except Exception:
+                return None
+            
+            # Get window title with error handling
+            try:
+                title = win32gui.GetWindowText(hwnd)
+            except Exception:
+                title = "Unknown Window"
+        
+        if listed_only and (rect[2] - rect[0] < 10 or rect[3] - rect[1] < 10 or not title):
+            info = (rect, title, None, None)
+            if self.cache_windows:
+                with self._hwnd_lock:
+                    self._hwnd_cache[hwnd] = info
+            return info
+        
+        # Get process name with error handling
+        try:
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            app_name = self._process_name(pid)
+        except Exception:
+            pid = None
+            app_name = "Unknown"
+        
+        info = (rect, title, pid, app_name)
+        if self.cache_windows:
+            with self._hwnd_lock:
+                self._hwnd_cache[hwnd] = info
+        return info
     
     async def get_active_application(self) -> Optional[str]:
         """Get the currently active application"""
         if not self.available:
             return None
-            
+        return await self._run(self._active_app_sync)
+    
+    def _active_app_sync(self) -> Optional[str]:
         try:
             hwnd = win32gui.GetForegroundWindow()
             if not hwnd:
                 return None
                 
-            try:
-                _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            except Exception:
-                return None
-                
-            try:
-                process = psutil.Process(pid)
-                return process.name()
-            except Exception:
+            info = self._window_info(hwnd)
+            if info is None or info[2] is None:
                 return None
+            return info[3] if info[3] != "Unknown" else None
                 
         except Exception as e:
             logger.warning(f"Failed to get active application: {e}")
@@ -80,76 +193,60 @@ class WindowDetector:
         """Detect all visible windows"""
         if not self.available:
             return []
-            
+        return await self._run(self._detect_windows_sync)
+    
+    def _detect_windows_sync(self) -> List[ScreenRegion]:
         regions = []
+        seen = set()
+        live_pids = set()
         
-        def enum_windows_proc(hwnd, _):
-            try:
-                if not win32gui.IsWindowVisible(hwnd):
-                    return True
-            except Exception:
-                return True
-                
+        # The EnumWindows callback only collects handles; all per-window work runs in the loop below
+        hwnds = []
+        try:
+            win32gui.EnumWindows(_collect_hwnd, hwnds)
+        except Exception as e:
+            logger.error(f"Error enumerating windows: {e}")
+        
+        is_visible = win32gui.IsWindowVisible
+        window_info = self._window_info
+        for hwnd in hwnds:
             try:
-                # Get window rect with error handling
-                try:
-                    rect = win32gui.GetWindowRect(hwnd)
-                except Exception:
-                    return True
-                    
-                if rect[2] - rect[0] < 10 or rect[3] - rect[1] < 10:  # Skip tiny windows
-                    return True
+                if not is_visible(hwnd):
+                    continue
                 
-                # Get window title with error handling
-                try:
-                    title = win32gui.GetWindowText(hwnd)
-                except Exception:
-                    title = "Unknown Window"
-                    
-                if not title:
-                    return True
-                
-                # Get process name with error handling
-                try:
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    process = psutil.Process(pid)
-                    app_name = process.name()
-                except Exception:
-                    app_name = "Unknown"
+                seen.add(hwnd)
+                info = window_info(hwnd, listed_only=True)
+                if info is None:
+                    continue
+                rect, title, pid, app_name = info
+                live_pids.add(pid)
                 
-                # Create screen region with validation
-                x, y = rect[0], rect[1]
+                # Skip tiny and untitled windows
                 width, height = rect[2] - rect[0], rect[3] - rect[1]
+                if width < 10 or height < 10 or not title:
+                    continue
                 
-                # Skip invalid windows
-                if width <= 0 or height <= 0:
-                    return True
-                
-                bounds = BoundingBox(x=x, y=y, width=width, height=height)
-                
-                region = ScreenRegion(
+                regions.append(ScreenRegion(
                     id=f"window_{hwnd}",
                     region_type=RegionType.WINDOW,
-                    bounds=bounds,
+                    bounds=BoundingBox.unchecked(rect[0], rect[1], width, height),  # ints, size checked above
                     confidence=0.9,
                     title=title,
                     application=app_name,
                     clickable=True,
                     focusable=True,
                     metadata={"hwnd": hwnd, "pid": pid}
-                )
-                
-                regions.append(region)
+                ))
                 
             except Exception as e:
                 logger.debug(f"Error processing window {hwnd}: {e}")
-                
-            return True
         
-        try:
-            win32gui.EnumWindows(enum_windows_proc, None)
-        except Exception as e:
-            logger.error(f"Error enumerating windows: {e}")
+        # Drop windows that are gone or hidden, and processes that no longer own a visible window
+        with self._hwnd_lock:
+            for hwnd in self._hwnd_cache.keys() - seen:
+                del self._hwnd_cache[hwnd]
+            for pid in self._processes.keys() - live_pids:
+                del self._processes[pid]
             
         return regions
     
@@ -157,30 +254,18 @@ class WindowDetector:
         """Get the currently focused window region"""
         if not self.available:
             return None
-            
+        return await self._run(self._focused_window_sync)
+    
+    def _focused_window_sync(self) -> Optional[ScreenRegion]:
         try:
             hwnd = win32gui.GetForegroundWindow()
             if not hwnd:
                 return None
                 
-            # Get window rect and title with error handling
-            try:
-                rect = win32gui.GetWindowRect(hwnd)
-            except Exception:
+            info = self._window_info(hwnd)
+            if info is None:
                 return None
-                
-            try:
-                title = win32gui.GetWindowText(hwnd)
-            except Exception:
-                title = "Unknown Window"
-            
-            # Get process info with error handling
-            try:
-                _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                process = psutil.Process(pid)
-                app_name = process.name()
-            except Exception:
-                app_name = "Unknown"
+            rect, title, pid, app_name = info
             
             bounds = BoundingBox(
                 x=rect[0],
@@ -223,11 +308,11 @@ class BasicRegionDetector:
         title_bar = ScreenRegion(
             id=f"{window_region.id}_titlebar",
             region_type=RegionType.TOOLBAR,
-            bounds=BoundingBox(
-                x=window_bounds.x,
-                y=window_bounds.y,
-                width=window_bounds.width,
-                height=30  # Standard title bar height
+            bounds=BoundingBox.unchecked(
+                window_bounds.x,
+                window_bounds.y,
+                window_bounds.width,
+                30  # Standard title bar height
             ),
             confidence=0.8,
             title="Title Bar",
@@ -257,13 +342,26 @@ class BasicRegionDetector:
         
         return regions
 
+# Application knowledge used by ContextExtractor, keyed by lowercased process name
+KNOWN_APPS = frozenset({
+    "notepad.exe", "chrome.exe", "firefox.exe", "code.exe",
+    "explorer.exe", "calculator.exe", "cmd.exe", "powershell.exe"
+})
+APP_SUGGESTIONS = {
+    "chrome.exe": ("Navigate to URL", "Open new tab", "Search"),
+    "notepad.exe": ("Save file", "Open file", "Find text"),
+    "code.exe": ("Open file", "Run command", "Search files"),
+    "explorer.exe": ("Navigate folders", "Create folder", "Copy files")
+}
+
 class ContextExtractor:
     """Extracts context information from the system state"""
     
     def __init__(self):
         self.application_contexts = {}
     
-    async def extract_visual_context(self, screenshot: bytes, regions: List[ScreenRegion]) -> List[ContextData]:
+    async def extract_visual_context(self, screenshot: bytes, regions: List[ScreenRegion],
+                                     timestamp: Optional[datetime] = None) -> List[ContextData]:
         """Extract visual context from screenshot and regions"""
         context_list = []
         
@@ -276,25 +374,21 @@ class ContextExtractor:
             "screenshot_size": len(screenshot) if screenshot else 0
         }
         
-        largest_area = 0
-        for region in regions:
-            region_type = region.region_type.value
-            visual_data["region_types"][region_type] = visual_data["region_types"].get(region_type, 0) + 1
-            
-            if region.clickable:
-                visual_data["clickable_regions"] += 1
-                
-            if region.bounds.area > largest_area:
-                largest_area = region.bounds.area
-                visual_data["largest_region"] = {
-                    "type": region_type,
-                    "title": region.title,
-                    "area": region.bounds.area
-                }
+        # Aggregates run in C (Counter/sum/max) instead of a per-region Python loop
+        visual_data["region_types"] = dict(Counter(region.region_type.value for region in regions))
+        visual_data["clickable_regions"] = sum(region.clickable for region in regions)
+        if regions:
+            # Bounds are validated positive, so the first largest region always qualifies
+            largest = max(regions, key=lambda region: region.bounds.area)
+            visual_data["largest_region"] = {
+                "type": largest.region_type.value,
+                "title": largest.title,
+                "area": largest.bounds.area
+            }
         
         context = ContextData(
             context_type=ContextType.VISUAL,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             data=visual_data,
             confidence=0.8,
             source="ContextExtractor",
@@ -304,7 +398,8 @@ class ContextExtractor:
         
         return context_list
     
-    async def extract_interactive_context(self, regions: List[ScreenRegion]) -> List[ContextData]:
+    async def extract_interactive_context(self, regions: List[ScreenRegion],
+                                          timestamp: Optional[datetime] = None) -> List[ContextData]:
         """Extract interactive context from regions"""
         interactive_data = {
             "available_actions": [],
@@ -312,24 +407,28 @@ class ContextExtractor:
             "focus_candidates": []
         }
         
+        available_actions = interactive_data["available_actions"]
+        interaction_points = interactive_data["interaction_points"]
+        focus_candidates = interactive_data["focus_candidates"]
         for region in regions:
             if region.clickable:
-                interactive_data["available_actions"].append({
+                available_actions.append({
                     "action": "click",
                     "target": region.id,
                     "description": f"Click on {region.title or region.region_type.value}",
                     "confidence": region.confidence
                 })
                 
-                interactive_data["interaction_points"].append({
-                    "x": region.bounds.center.x,
-                    "y": region.bounds.center.y,
+                center = region.bounds.center
+                interaction_points.append({
+                    "x": center.x,
+                    "y": center.y,
                     "type": "click",
                     "region_id": region.id
                 })
             
             if region.focusable:
-                interactive_data["focus_candidates"].append({
+                focus_candidates.append({
                     "region_id": region.id,
                     "type": region.region_type.value,
                     "title": region.title
@@ -337,7 +436,7 @@ class ContextExtractor:
         
         context = ContextData(
             context_type=ContextType.INTERACTIVE,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             data=interactive_data,
             confidence=0.9,
             source="ContextExtractor",
@@ -346,11 +445,13 @@ class ContextExtractor:
         
         return [context]
     
-    async def extract_application_context(self, app_name: str, focused_region: Optional[ScreenRegion]) -> List[ContextData]:
+    async def extract_application_context(self, app_name: str, focused_region: Optional[ScreenRegion],
+                                          timestamp: Optional[datetime] = None) -> List[ContextData]:
         """Extract application-specific context"""
+        app_key = app_name.lower() if app_name else ""  # lowercased once for every table lookup
         app_data = {
             "application": app_name,
-            "is_known_app": self._is_known_application(app_name),
+            "is_known_app": self._is_known_application(app_key),
             "focused_element": None,
             "suggested_actions": []
         }
@@ -368,12 +469,12 @@ class ContextExtractor:
             }
         
         # Add application-specific suggestions
-        if app_name:
-            app_data["suggested_actions"] = self._get_app_suggestions(app_name)
+        if app_key:
+            app_data["suggested_actions"] = self._get_app_suggestions(app_key)
         
         context = ContextData(
             context_type=ContextType.APPLICATION,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             data=app_data,
             confidence=0.7,
             source="ContextExtractor",
@@ -382,23 +483,27 @@ class ContextExtractor:
         
         return [context]
     
-    def _is_known_application(self, app_name: str) -> bool:
-        """Check if we have specific knowledge about this application"""
-        known_apps = {
-            "notepad.exe", "chrome.exe", "firefox.exe", "code.exe",
-            "explorer.exe", "calculator.exe", "cmd.exe", "powershell.exe"
-        }
-        return app_name.lower() in known_apps if app_name else False
-    
-    def _get_app_suggestions(self, app_name: str) -> List[str]:
-        """Get application-specific action suggestions"""
-        suggestions = {
-            "chrome.exe": ["Navigate to URL", "Open new tab", "Search"],
-            "notepad.exe": ["Save file", "Open file", "Find text"],
-            "code.exe": ["Open file", "Run command", "Search files"],
-            "explorer.exe": ["Navigate folders", "Create folder", "Copy files"]
-        }
-        return suggestions.get(app_name.lower(), []) if app_name else []
+    def _is_known_application(self, app_key: str) -> bool:
+        """Check if we have specific knowledge about this application (app_key is the lowercased name)"""
+        return app_key in KNOWN_APPS
+    
+    def _get_app_suggestions(self, app_key: str) -> List[str]:
+        """Get application-specific action suggestions (app_key is the lowercased name)"""
+        return list(APP_SUGGESTIONS.get(app_key, ()))
+
+# Hotkey actions offered while a known application is focused
+APP_ACTIONS = {
+    "notepad.exe": (
+        NeuroAction("save_file", "Save the current file", {"hotkey": ["ctrl", "s"]}),
+        NeuroAction("open_file", "Open a file", {"hotkey": ["ctrl", "o"]}),
+        NeuroAction("find_text", "Find text in document", {"hotkey": ["ctrl", "f"]})
+    ),
+    "chrome.exe": (
+        NeuroAction("new_tab", "Open new tab", {"hotkey": ["ctrl", "t"]}),
+        NeuroAction("close_tab", "Close current tab", {"hotkey": ["ctrl", "w"]}),
+        NeuroAction("refresh", "Refresh page", {"key": "F5"})
+    )
+}
 
 class RegionalizationCore:
     """Main regionalization system coordinator"""
@@ -418,18 +523,45 @@ class RegionalizationCore:
             logger.info("Vision API client initialized")
         
         self.current_state: Optional[SystemState] = None
+        self._regions_by_type: Optional[Dict[RegionType, List[ScreenRegion]]] = None  # built on first query per state
         self.update_interval = 2.0  # seconds
         self.running = False
         self._last_ocr_elements = []
         self._last_vision_analysis = None
         self._vision_update_counter = 0
         self._vision_update_interval = 10  # Update vision every 10 regular updates (20 seconds)
+        self.screenshot_every = 3  # state rebuilds per fresh capture; the ones between reuse the last frame
+        self._screenshot_counter = 0
+        self._last_screenshot = None
+        self._last_screenshot_bounds = None  # focused window bounds _last_screenshot was captured at
+        
+        # Set whenever an update produces a different state; consumers wait on it instead of polling
+        self.state_changed = asyncio.Event()
+        self._state_signature = None
+        self._window_signature = None  # windows the current regions/context/actions were built from
+        self._action_cache: Dict[tuple, NeuroAction] = {}  # click actions from the last rebuild, by region identity
         
+        # Window events pushed by the OS wake the update loop; without them it rescans every update_interval
+        self.needs_update = True
+        self.max_idle_interval = 10.0  # seconds; rescan anyway for changes hooks don't report (page content)
+        self.min_update_interval = 0.25  # seconds between rescans while events keep arriving (window drags)
+        self.event_settle_delay = 0.05  # seconds to let a burst of window events collapse into one rescan
+        self._dirty = asyncio.Event()
+        self._loop = None
+        self._win_events = None
+        if WinEventWatcher and WinEventWatcher.available:
+            self._win_events = WinEventWatcher(self._mark_dirty)
+                
     async def start(self):
         """Start the regionalization system"""
         self.running = True
+        self._loop = asyncio.get_running_loop()
         logger.info("Starting regionalization system")
         
+        if self._win_events:
+            self._win_events.start()
+            self.window_detector.cache_windows = True
+        
         # Start the main update loop
         asyncio.create_task(self._update_loop())
     
@@ -437,10 +569,15 @@ class RegionalizationCore:
         """Stop the regionalization system"""
         self.running = False
         
-        # Release vision API session
+        if self._win_events:
+            self._win_events.stop()
+            self.window_detector.cache_windows = False
+            self.window_detector.invalidate()
+        
+        # Release vision API session and its connections
         if self.vision_client:
             try:
-                self.vision_client.release_session()
+                self.vision_client.close()
             except Exception:
                 pass
         
@@ -450,57 +587,93 @@ class RegionalizationCore:
         """Main update loop that refreshes system state"""
         while self.running:
             try:
+                # Sleep until a window hook reports a change (or the interval runs out)
+                if not self.needs_update:
+                    timeout = self.max_idle_interval if self._win_events else self.update_interval
+                    try:
+                        await asyncio.wait_for(self._dirty.wait(), timeout=timeout)
+                        await asyncio.sleep(self.event_settle_delay)
+                    except asyncio.TimeoutError:
+                        pass
+                self._dirty.clear()
+                self.needs_update = False
                 await self._update_system_state()
-                await asyncio.sleep(self.update_interval)
+                await asyncio.sleep(self.min_update_interval)
             except Exception as e:
                 logger.error(f"Error in update loop: {e}")
                 await asyncio.sleep(1.0)  # Brief pause on error
     
+    def _mark_dirty(self, hwnd: Optional[int] = None):
+        """Called from the window hook thread when a window may have changed"""
+        self.window_detector.invalidate(hwnd)
+        if not self.needs_update:
+            # Only the first event since the last rescan has to wake the loop
+            self.needs_update = True
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._dirty.set)
+    
     async def _update_system_state(self):
         """Update the current system state"""
         try:
-            # Get active application
-            active_app = await self.window_detector.get_active_application()
-            
-            # Detect windows
-            window_regions = await self.window_detector.detect_windows()
-            
-            # Get focused window
-            focused_region = await self.window_detector.get_focused_window()
-            
-            # Detect UI regions within focused window
-            ui_regions = []
-            if focused_region:
-                screenshot = await self._take_screenshot()
-                ui_regions = await self.basic_detector.detect_ui_regions(screenshot, focused_region)
-            
-            # Combine all regions
-            all_regions = window_regions + ui_regions
-            
-            # Extract context
-            context_data = []
-            if all_regions:
-                screenshot = await self._take_screenshot()
-                visual_context = await self.context_extractor.extract_visual_context(screenshot, all_regions)
-                interactive_context = await self.context_extractor.extract_interactive_context(all_regions)
-                app_context = await self.context_extractor.extract_application_context(active_app, focused_region)
-                
-                context_data.extend(visual_context)
-                context_data.extend(interactive_context) 
-                context_data.extend(app_context)
+            now = datetime.now()  # one timestamp for everything built this tick
             
-            # Generate available actions
-            available_actions = await self._generate_actions(all_regions, active_app)
+            # The window queries are independent of each other
+            active_app, window_regions, focused_region = await asyncio.gather(
+                self.window_detector.get_active_application(),
+                self.window_detector.detect_windows(),
+                self.window_detector.get_focused_window(),
+            )
             
-            # Update system state
-            self.current_state = SystemState(
-                active_application=active_app,
-                focused_region=focused_region,
-                all_regions=all_regions,
-                context_data=context_data,
-                available_actions=available_actions,
-                timestamp=datetime.now()
+            # Same windows, titles and geometry as last tick: the regions, context and actions built
+            # from them would come out identical, so keep them and only refresh the timestamp
+            window_signature = (
+                active_app,
+                (focused_region.id, focused_region.title, focused_region.bounds)
+                if focused_region else None,
+                tuple((r.id, r.title, r.bounds) for r in window_regions),
             )
+            if self.current_state is not None and window_signature == self._window_signature:
+                self.current_state.timestamp = now
+                self.current_state.timestamp_ns = time.monotonic_ns()
+            else:
+                # One screenshot serves the whole rebuild
+                screenshot = await self._tick_screenshot(focused_region)
+                
+                # Detect UI regions within focused window
+                ui_regions = []
+                if focused_region:
+                    ui_regions = await self.basic_detector.detect_ui_regions(screenshot, focused_region)
+                
+                # Combine all regions
+                all_regions = window_regions + ui_regions
+                
+                # Extract context
+                context_data = []
+                if all_regions:
+                    visual_context, interactive_context, app_context = await asyncio.gather(
+                        self.context_extractor.extract_visual_context(screenshot, all_regions, now),
+                        self.context_extractor.extract_interactive_context(all_regions, now),
+                        self.context_extractor.extract_application_context(active_app, focused_region, now),
+                    )
+                
+                    context_data.extend(visual_context)
+                    context_data.extend(interactive_context) 
+                    context_data.extend(app_context)
+                
+                # Generate available actions
+                available_actions = await self._generate_actions(all_regions, active_app)
+                
+                # Update system state
+                self._regions_by_type = None
+                self.current_state = SystemState(
+                    active_application=active_app,
+                    focused_region=focused_region,
+                    all_regions=all_regions,
+                    context_data=context_data,
+                    available_actions=available_actions,
+                    timestamp=now
+                )
+                self._window_signature = window_signature
             
             # Run OCR detection on current screen
             if self.ocr_detector:
@@ -517,9 +690,10 @@ class RegionalizationCore:
                 if self._vision_update_counter >= self._vision_update_interval:
                     self._vision_update_counter = 0
                     try:
-                        screenshot = await self._take_screenshot()
+                        # The tick's frame is raw pixels; the vision API needs an encoded image
+                        screenshot = await self._take_screenshot(encode=self.vision_client.image_format)
                         if screenshot and screenshot != b"screenshot_placeholder":
-                            analysis = self.vision_client.analyze_screenshot(
+                            analysis = await self.vision_client.analyze_screenshot_async(
                                 screenshot_bytes=screenshot,
                                 prompt="Analyze this Windows UI screenshot. List all visible UI elements (buttons, links, text fields, menus) with their locations (top-left, center, bottom-right, etc). Be specific and concise."
                             )
@@ -532,14 +706,50 @@ class RegionalizationCore:
             # Update message builder
             self.message_builder.update_state(self.current_state)
             
-            logger.debug(f"Updated system state: {len(all_regions)} regions, {len(context_data)} context items")
+            # Notify consumers only when something they would report actually changed
+            signature = self._compute_state_signature()
+            if signature != self._state_signature:
+                self._state_signature = signature
+                self.state_changed.set()
+            
+            logger.debug(f"Updated system state: {len(self.current_state.all_regions)} regions, "
+                         f"{len(self.current_state.context_data)} context items")
             
         except Exception as e:
             logger.error(f"Error updating system state: {e}")
     
-    async def _take_screenshot(self) -> bytes:
-        """Take a screenshot of the current screen with enhanced error handling"""
-        if not pyautogui:
+    def _compute_state_signature(self) -> tuple:
+        """Cheap summary of the tracked state, used to detect changes between updates"""
+        return (
+            # Covers every region: the focused window's UI regions are derived from its bounds
+            self._window_signature,
+            tuple((e.text, e.bbox) for e in self._last_ocr_elements),
+            self._last_vision_analysis,
+        )
+    
+    async def _tick_screenshot(self, focused_region: Optional[ScreenRegion]) -> bytes:
+        """Screenshot for a state rebuild: the focused window only, freshly captured every screenshot_every-th call
+
+        A frame is only reused for the same focused window geometry; when focus moves or the
+        window is moved/resized the old frame shows something else, so it is recaptured at once.
+        """
+        bounds = focused_region.bounds if focused_region else None
+        if (self._last_screenshot is None or bounds != self._last_screenshot_bounds
+                or self._screenshot_counter % self.screenshot_every == 0):
+            self._last_screenshot = await self._take_screenshot(bounds=bounds)
+            self._last_screenshot_bounds = bounds
+            self._screenshot_counter = 0
+        self._screenshot_counter += 1
+        return self._last_screenshot
+    
+    async def _take_screenshot(self, encode: Optional[str] = None, bounds: Optional[BoundingBox] = None) -> bytes:
+        """Take a screenshot of the current screen with enhanced error handling
+        
+        Returns raw pixel bytes, which is all the per-tick consumers need (they only
+        look at the size); encode="JPEG"/"PNG" returns an image file for consumers that decode it.
+        bounds limits the capture to that rectangle instead of the whole virtual desktop.
+        """
+        if not pyautogui and not mss:
             return b"screenshot_unavailable"
             
         try:
@@ -547,6 +757,25 @@ class RegionalizationCore:
             loop = asyncio.get_event_loop()
             
             def take_screenshot_sync():
+                if mss:
+                    try:
+                        # mss handles are per-thread, so open one per capture
+                        with mss.mss() as sct:
+                            if bounds:
+                                area = {"left": bounds.x, "top": bounds.y, "width": bounds.width, "height": bounds.height}
+                            else:
+                                area = sct.monitors[0]
+                            shot = sct.grab(area)
+                            if not encode:
+                                return shot.raw
+                            if encode.upper() == "PNG":
+                                return mss.tools.to_png(shot.rgb, shot.size)
+                            from PIL import Image
+                            return encode_image(Image.frombytes("RGB", shot.size, shot.rgb), encode)
+                    except Exception as e:
+                        logger.debug(f"mss capture failed, falling back to pyautogui: {e}")
+                        if not pyautogui:
+                            return None
                 try:
                     # Disable failsafe to prevent hang
                     pyautogui.FAILSAFE = False
@@ -558,16 +787,17 @@ class RegionalizationCore:
                         return None
                     
                     # Take screenshot
-                    screenshot = pyautogui.screenshot()
+                    region = (bounds.x, bounds.y, bounds.width, bounds.height) if bounds else None
+                    screenshot = pyautogui.screenshot(region=region)
                     if screenshot is None:
                         logger.error("Screenshot returned None")
                         return None
                         
+                    if not encode:
+                        return screenshot.tobytes()  # Skip the image encode nobody reads
+                    
                     # Convert to bytes
-                    from io import BytesIO
-                    buffer = BytesIO()
-                    screenshot.save(buffer, format='PNG')
-                    return buffer.getvalue()
+                    return encode_image(screenshot, encode)
                     
                 except Exception as e:
                     logger.error(f"Screenshot capture error: {e}")
@@ -594,45 +824,35 @@ class RegionalizationCore:
     
     async def _generate_actions(self, regions: List[ScreenRegion], app_name: Optional[str]) -> List[NeuroAction]:
         """Generate available actions based on current state"""
-        actions = []
-        
-        # Basic click actions for clickable regions
+        # Basic click actions for clickable regions; unchanged regions keep last rebuild's action object
+        previous = self._action_cache
+        cache = {}
         for region in regions:
             if region.clickable:
-                action = NeuroAction(
-                    name=f"click_{region.id}",
-                    description=f"Click on {region.title or region.region_type.value}",
-                    parameters={"x": region.bounds.center.x, "y": region.bounds.center.y},
-                    target_region=region,
-                    estimated_duration=0.5
-                )
-                actions.append(action)
+                key = (region.id, region.title, region.region_type, region.bounds)
+                action = previous.get(key)
+                if action is None:
+                    center = region.bounds.center
+                    action = NeuroAction(
+                        name=f"click_{region.id}",
+                        description=f"Click on {region.title or region.region_type.value}",
+                        parameters={"x": center.x, "y": center.y},
+                        target_region=region,
+                        estimated_duration=0.5
+                    )
+                cache[key] = action
+        self._action_cache = cache
+        actions = list(cache.values())
         
         # Application-specific actions
         if app_name:
-            app_actions = self._get_application_actions(app_name)
-            actions.extend(app_actions)
+            actions.extend(self._get_application_actions(app_name))
         
         return actions
     
     def _get_application_actions(self, app_name: str) -> List[NeuroAction]:
         """Get application-specific actions"""
-        actions = []
-        
-        app_specific = {
-            "notepad.exe": [
-                NeuroAction("save_file", "Save the current file", {"hotkey": ["ctrl", "s"]}),
-                NeuroAction("open_file", "Open a file", {"hotkey": ["ctrl", "o"]}),
-                NeuroAction("find_text", "Find text in document", {"hotkey": ["ctrl", "f"]})
-            ],
-            "chrome.exe": [
-                NeuroAction("new_tab", "Open new tab", {"hotkey": ["ctrl", "t"]}),
-                NeuroAction("close_tab", "Close current tab", {"hotkey": ["ctrl", "w"]}),
-                NeuroAction("refresh", "Refresh page", {"key": "F5"})
-            ]
-        }
-        
-        return app_specific.get(app_name.lower(), []) if app_name else []
+        return list(APP_ACTIONS.get(app_name.lower(), ())) if app_name else []
     
     def get_current_state(self) -> Optional[SystemState]:
         """Get the current system state"""
@@ -670,6 +890,12 @@ class RegionalizationCore:
         """Get all regions of a specific type"""
         if not self.current_state:
             return []
-            
-        return [region for region in self.current_state.all_regions 
-                if region.region_type == region_type]
\ No newline at end of file
+        
+        # One pass groups every type; later queries against the same state are dict lookups
+        index = self._regions_by_type
+        if index is None:
+            index = {}
+            for region in self.current_state.all_regions:
+                index.setdefault(region.region_type, []).append(region)
+            self._regions_by_type = index
+        return list(index.get(region_type, ()))
\ No newline at end of file
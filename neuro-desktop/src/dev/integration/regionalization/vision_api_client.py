@@ -2,38 +2,127 @@
 Nakurity Vision API Client
 Sends screenshots to Groq vision API for detailed analysis
 """
+import time
+import socket
+import asyncio
 import base64
 import logging
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 from typing import Optional, Dict
 from io import BytesIO
 
+# Optional: SIMD base64 (AVX2/AVX-512/NEON), much faster than the stdlib on multi-MB screenshots
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 logger = logging.getLogger(__name__)
 
+JPEG_QUALITY = 85
+STREAM_THRESHOLD = 4 * 1024 * 1024  # encoded images above this are uploaded as a chunked stream
+STREAM_CHUNK = 57 * 1024  # raw bytes per base64 chunk; a multiple of 3, so no padding mid-stream
+CONTROL_TIMEOUT = (3.0, 10.0)  # (connect, read) for session claim/heartbeat/release
+VISION_TIMEOUT = (3.0, 30.0)  # (connect, read); an unreachable host fails in 3 s, the model gets 30 s
+
+_image_buffers = threading.local()  # one reusable encode buffer per thread
+
+def _encode_to_buffer(image, image_format: str) -> BytesIO:
+    """Encode into this thread's reusable buffer; its contents are valid until the thread's next encode"""
+    buffer = getattr(_image_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _image_buffers.buffer = BytesIO()
+    # Overwrite from the start and cut what is left of a longer previous image,
+    # so the buffer's storage is reused instead of regrown every call
+    buffer.seek(0)
+    if image_format.upper() in ("JPEG", "JPG"):
+        if image.mode != "RGB":
+            image = image.convert("RGB")  # JPEG has no alpha channel
+        image.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=False)
+    else:
+        image.save(buffer, format=image_format)
+    buffer.truncate()
+    return buffer
+
+def encode_image(image, image_format: str = "JPEG") -> bytes:
+    """Encode a PIL image for upload; JPEG is several times smaller and faster to produce than PNG deflate"""
+    return _encode_to_buffer(image, image_format).getvalue()
+
+def _b64encode(data) -> bytes:
+    return pybase64.b64encode(data) if pybase64 else base64.b64encode(data)
+
+def _iter_json_body(image_bytes, prompt_json: bytes):
+    """Yield the request body with the image base64-encoded chunk by chunk, so sending starts
+    before the whole image is encoded and the full base64 copy is never held in memory"""
+    view = memoryview(image_bytes)  # zero-copy slices, also for bytes input
+    try:
+        yield b'{"image":"'
+        for start in range(0, len(view), STREAM_CHUNK):
+            yield _b64encode(view[start:start + STREAM_CHUNK])
+        yield b'","prompt":'
+        yield prompt_json
+        yield b"}"
+    finally:
+        view.release()
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets keep urllib3's TCP_NODELAY and add TCP keepalive, so pooled
+    connections idling between heartbeats are noticed dead instead of failing the next request"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ])
+        super().init_poolmanager(*args, **kwargs)
+
 class VisionAPIClient:
     """Client for Nakurity Vision API with session-based authentication"""
     
-    def __init__(self, base_url: str = None, session_key: str = None):
+    def __init__(self, base_url: str = None, session_key: str = None, image_format: str = "JPEG"):
         self.base_url = base_url or "https://backend.nakurity.com/api"
         self.vision_endpoint = f"{self.base_url}/neuro-os/vision"
         self.session_endpoint = f"{self.base_url}/session"
-        self.session_key = session_key
+        self.image_format = image_format  # "PNG" for lossless uploads
         self.session = requests.Session()
+        # One backend host: a small pool of warm connections so heartbeats don't evict the vision
+        # connection. Failed connects are retried for every method (no body has been sent yet);
+        # 5xx responses only for GETs, since POST bodies may be one-shot streams
+        adapter = _KeepAliveAdapter(pool_connections=1, pool_maxsize=4, max_retries=Retry(
+            total=3, connect=3, read=0, backoff_factor=0.3,
+            status_forcelist=(502, 503, 504), allowed_methods=frozenset({"GET"}),
+            raise_on_status=False
+        ))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             'Content-Type': 'application/json'
         })
+        self._set_session_key(session_key)
         self._heartbeat_interval = 60  # seconds
-        self._last_heartbeat = 0
+        self._next_heartbeat = 0.0  # time.monotonic() at which the next heartbeat is due
+    
+    def _set_session_key(self, key: Optional[str]):
+        """Store the session key and install it as a default header on every session request"""
+        self.session_key = key
+        if key:
+            self.session.headers['X-Session-Key'] = key
+        else:
+            self.session.headers.pop('X-Session-Key', None)
     
     def claim_session(self) -> bool:
         """Claim a new session key from the backend"""
         try:
-            response = self.session.get(f"{self.session_endpoint}/claim", timeout=10)
+            response = self.session.get(f"{self.session_endpoint}/claim", timeout=CONTROL_TIMEOUT)
             response.raise_for_status()
             
             result = response.json()
             if result.get('success'):
-                self.session_key = result.get('sessionKey')
+                self._set_session_key(result.get('sessionKey'))
                 self._heartbeat_interval = result.get('heartbeatInterval', 60000) / 1000
                 logger.info(f"Session claimed successfully: {self.session_key[:8]}...")
                 return True
@@ -50,18 +139,15 @@ class VisionAPIClient:
         if not self.session_key:
             return False
         
-        import time
-        now = time.time()
-        if now - self._last_heartbeat < self._heartbeat_interval:
+        now = time.monotonic()
+        if now < self._next_heartbeat:
             return True  # Not time yet
         
         try:
-            headers = {'X-Session-Key': self.session_key}
-            response = self.session.post(f"{self.session_endpoint}/heartbeat", 
-                                        headers=headers, timeout=10)
+            response = self.session.post(f"{self.session_endpoint}/heartbeat", timeout=CONTROL_TIMEOUT)
             response.raise_for_status()
             
-            self._last_heartbeat = now
+            self._next_heartbeat = now + self._heartbeat_interval
             return True
             
         except Exception as e:
@@ -74,13 +160,11 @@ class VisionAPIClient:
             return True
         
         try:
-            headers = {'X-Session-Key': self.session_key}
-            response = self.session.post(f"{self.session_endpoint}/release",
-                                        headers=headers, timeout=10)
+            response = self.session.post(f"{self.session_endpoint}/release", timeout=CONTROL_TIMEOUT)
             response.raise_for_status()
             
             logger.info("Session released")
-            self.session_key = None
+            self._set_session_key(None)
             return True
             
         except Exception as e:
@@ -94,7 +178,7 @@ class VisionAPIClient:
         
         Args:
             screenshot_image: PIL Image object
-            screenshot_bytes: Raw image bytes
+            screenshot_bytes: Encoded image bytes (sent as-is)
             prompt: Optional custom prompt
             
         Returns:
@@ -109,12 +193,12 @@ class VisionAPIClient:
         # Send heartbeat if needed
         self.send_heartbeat()
         
+        view = None  # zero-copy view of the thread's encode buffer; released before returning
+        stream = None  # chunked body generator; closed before the view so it drops its slice
         try:
             # Convert image to base64
             if screenshot_image:
-                buffer = BytesIO()
-                screenshot_image.save(buffer, format='PNG')
-                image_bytes = buffer.getvalue()
+                view = image_bytes = _encode_to_buffer(screenshot_image, self.image_format).getbuffer()
             elif screenshot_bytes:
                 image_bytes = screenshot_bytes
             else:
@@ -122,34 +206,33 @@ class VisionAPIClient:
                 try:
                     import pyautogui
                     screenshot = pyautogui.screenshot()
-                    buffer = BytesIO()
-                    screenshot.save(buffer, format='PNG')
-                    image_bytes = buffer.getvalue()
+                    view = image_bytes = _encode_to_buffer(screenshot, self.image_format).getbuffer()
                 except Exception as e:
                     logger.error(f"Failed to take screenshot: {e}")
                     return None
             
-            # Encode to base64
-            image_b64 = base64.b64encode(image_bytes).decode('utf-8')
-            
-            # Prepare request
-            payload = {
-                'image': image_b64,
-                'prompt': prompt
-            }
-            
-            # Call API with session authentication
-            headers = {'X-Session-Key': self.session_key}
-            response = self.session.post(self.vision_endpoint, json=payload, 
-                                        headers=headers, timeout=30)
+            # Assemble the JSON body around the base64 bytes: base64 needs no escaping,
+            # so the multi-MB image is never decoded to str or re-serialized by requests
+            prompt_json = orjson.dumps(prompt)  # bytes, no str round trip
+            if len(image_bytes) > STREAM_THRESHOLD:
+                # Very large captures go out as a chunked upload, encoding while the socket sends
+                body = stream = _iter_json_body(image_bytes, prompt_json)
+            else:
+                body = b"".join((b'{"image":"', _b64encode(image_bytes), b'","prompt":', prompt_json, b"}"))
             
-            if response.status_code == 401:
+            # Call API with session authentication (Content-Type and X-Session-Key are set on the session)
+            for attempt in range(2):
+                response = self.session.post(self.vision_endpoint, data=body, timeout=VISION_TIMEOUT)
+                if response.status_code != 401:
+                    break
                 logger.error("Vision API authentication failed - session expired, reclaiming...")
-                self.session_key = None
-                if self.claim_session():
-                    # Retry with new session
-                    return self.analyze_screenshot(screenshot_bytes=image_bytes, prompt=prompt)
-                return None
+                self._set_session_key(None)
+                if attempt or not self.claim_session():
+                    return None  # a freshly claimed session was rejected too; don't keep reclaiming
+                # Retry once with the new session, reusing the encoded body (a consumed stream is rebuilt)
+                if stream is not None:
+                    stream.close()
+                    body = stream = _iter_json_body(image_bytes, prompt_json)
             
             if response.status_code == 429:
                 logger.warning("Vision API rate limit exceeded")
@@ -172,14 +255,31 @@ class VisionAPIClient:
         except Exception as e:
             logger.error(f"Vision analysis failed: {e}")
             return None
+        finally:
+            if stream is not None:
+                stream.close()
+            if view is not None:
+                view.release()  # the buffer can't be resized while a view is exported
+    
+    async def analyze_screenshot_async(self, screenshot_image=None, screenshot_bytes: bytes = None,
+                                       prompt: Optional[str] = None) -> Optional[str]:
+        """analyze_screenshot() on a worker thread, so encoding and the HTTP round trip don't block the event loop"""
+        return await asyncio.to_thread(self.analyze_screenshot, screenshot_image=screenshot_image,
+                                       screenshot_bytes=screenshot_bytes, prompt=prompt)
     
     def is_available(self) -> bool:
         """Check if vision API is configured and available"""
         return bool(self.base_url and (self.session_key or self.claim_session()))
     
-    def __del__(self):
-        """Release session on cleanup"""
+    def close(self):
+        """Release the session key and close the pooled connections; the client reclaims a session if used again"""
         try:
             self.release_session()
-        except Exception:
-            pass
+        finally:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
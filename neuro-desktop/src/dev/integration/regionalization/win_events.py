@@ -0,0 +1,110 @@
+"""
+Windows event hook watcher for Neuro-OS
+Reports foreground/window changes pushed by the OS so regionalization
+only rescans the desktop when something may have changed
+"""
+import sys
+import ctypes
+import logging
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# WinEvent constants (winuser.h)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MINIMIZESTART = 0x0016
+EVENT_SYSTEM_MINIMIZEEND = 0x0017
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WM_QUIT = 0x0012
+
+# (min, max) event ranges to hook; object events cover create/destroy/show/hide/location/name
+EVENT_RANGES = (
+    (EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND),
+    (EVENT_SYSTEM_MINIMIZESTART, EVENT_SYSTEM_MINIMIZEEND),
+    (EVENT_OBJECT_CREATE, EVENT_OBJECT_NAMECHANGE),
+)
+
+class WinEventWatcher:
+    """Runs SetWinEventHook on a background message-loop thread and calls on_change(hwnd) per window event"""
+
+    available = sys.platform == "win32"
+
+    def __init__(self, on_change: Callable[[int], None]):
+        self.on_change = on_change
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = None
+        self._proc = None  # keeps the ctypes callback alive while hooked
+
+    def start(self):
+        """Start the hook thread (no-op when not on Windows or already running)"""
+        if not self.available or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="neuro-os-winevents", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ask the hook thread to unhook and exit"""
+        if self._thread is None:
+            return
+        if self._thread_id is not None:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        self._thread = None
+        self._thread_id = None
+
+    def _callback(self, hook, event, hwnd, id_object, id_child, thread_id, time_ms):
+        # Only whole-window events; the cursor and carets fire LOCATIONCHANGE constantly
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF or not hwnd:
+            return
+        try:
+            self.on_change(hwnd)
+        except Exception as e:
+            logger.debug(f"WinEvent callback failed: {e}")
+
+    def _run(self):
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+        )
+        user32.SetWinEventHook.argtypes = (
+            wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+            wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+        )
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+
+        self._proc = WinEventProc(self._callback)
+        self._thread_id = kernel32.GetCurrentThreadId()
+
+        hooks = []
+        for event_min, event_max in EVENT_RANGES:
+            hook = user32.SetWinEventHook(
+                event_min, event_max, None, self._proc, 0, 0,
+                WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+            )
+            if hook:
+                hooks.append(hook)
+            else:
+                logger.warning(f"SetWinEventHook failed for events {event_min:#x}-{event_max:#x}")
+
+        # Out-of-context hooks are delivered through this thread's message queue
+        msg = wintypes.MSG()
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                user32.UnhookWinEvent(hook)
+            self._proc = None
@@ -0,0 +1,107 @@
+"""
+Process and window lookups for Neuro-OS window detection
+Reads executable names and window geometry/titles straight from kernel32/user32,
+skipping psutil's per-call object construction and pywin32's per-call wrappers
+"""
+import os
+import sys
+import ctypes
+import threading
+from typing import Optional, Tuple
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+MAX_IMAGE_PATH = 32768  # wchars; QueryFullProcessImageNameW can return long (\\?\) paths
+MAX_TITLE = 512  # wchars of window title kept
+
+query_process_image = None
+query_window = None
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _OpenProcess.restype = wintypes.HANDLE
+
+    _GetProcessTimes = _kernel32.GetProcessTimes
+    _GetProcessTimes.argtypes = (wintypes.HANDLE,) + (ctypes.POINTER(wintypes.FILETIME),) * 4
+    _GetProcessTimes.restype = wintypes.BOOL
+
+    _QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+    _QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)
+    )
+    _QueryFullProcessImageNameW.restype = wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = (wintypes.HANDLE,)
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+    class WINDOWINFO(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("rcWindow", wintypes.RECT),
+            ("rcClient", wintypes.RECT),
+            ("dwStyle", wintypes.DWORD),
+            ("dwExStyle", wintypes.DWORD),
+            ("dwWindowStatus", wintypes.DWORD),
+            ("cxWindowBorders", wintypes.UINT),
+            ("cyWindowBorders", wintypes.UINT),
+            ("atomWindowType", wintypes.ATOM),
+            ("wCreatorVersion", wintypes.WORD),
+        ]
+
+    _GetWindowInfo = _user32.GetWindowInfo
+    _GetWindowInfo.argtypes = (wintypes.HWND, ctypes.POINTER(WINDOWINFO))
+    _GetWindowInfo.restype = wintypes.BOOL
+
+    # Reads the title the window manager already holds; never sends WM_GETTEXT to the window
+    _InternalGetWindowText = _user32.InternalGetWindowText
+    _InternalGetWindowText.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+    _InternalGetWindowText.restype = ctypes.c_int
+
+    _buffers = threading.local()  # path/title buffers, one set per worker thread
+
+    def query_process_image(pid: int, cached: Optional[Tuple] = None) -> Optional[Tuple[int, str]]:
+        """(create_time, exe name) for pid through one process handle, or None if it can't be opened
+
+        When cached is a previous result for the same process (same create time) it is
+        returned as-is, so a known process costs OpenProcess + GetProcessTimes only.
+        """
+        handle = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            created, exited, kernel, user = (wintypes.FILETIME() for _ in range(4))
+            if not _GetProcessTimes(handle, created, exited, kernel, user):
+                return None
+            create_time = (created.dwHighDateTime << 32) | created.dwLowDateTime
+            if cached is not None and cached[0] == create_time:
+                return cached
+
+            buf = getattr(_buffers, "path", None)
+            if buf is None:
+                buf = _buffers.path = ctypes.create_unicode_buffer(MAX_IMAGE_PATH)
+            size = wintypes.DWORD(MAX_IMAGE_PATH)
+            if not _QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+                return None
+            return create_time, os.path.basename(buf.value)
+        finally:
+            _CloseHandle(handle)
+
+    def query_window(hwnd: int) -> Optional[Tuple[Tuple[int, int, int, int], str]]:
+        """((left, top, right, bottom), title) for a window, or None if it is gone"""
+        info = WINDOWINFO()
+        info.cbSize = ctypes.sizeof(WINDOWINFO)
+        if not _GetWindowInfo(hwnd, info):
+            return None
+        rc = info.rcWindow
+
+        buf = getattr(_buffers, "title", None)
+        if buf is None:
+            buf = _buffers.title = ctypes.create_unicode_buffer(MAX_TITLE)
+        length = _InternalGetWindowText(hwnd, buf, MAX_TITLE)
+        return (rc.left, rc.top, rc.right, rc.bottom), buf.value[:length]
@@ -0,0 +1,347 @@
+"""
+Tracer for Neuro-OS debugging
+Extends nakuritycore's Tracer with a log file that stays open between events
+and batched, thread-safe writes to it
+"""
+import os
+import re
+import sys
+import time
+import atexit
+import threading
+import linecache
+from pathlib import Path
+from types import FunctionType
+
+from nakuritycore.utils import Tracer as BaseTracer
+from nakuritycore.data.config import TracerConfig
+
+class Tracer(BaseTracer):
+    """Tracer that buffers its log file output instead of reopening the log per event
+
+    Trace lines go to stdout as they happen, so they stay in order with the program's own
+    output; only the plain-text copy for the log file is batched. The buffers are shared by
+    every traced thread (sys.monitoring callbacks fire on all of them) and guarded by one lock.
+    """
+
+    FLUSH_EVERY = 256  # trace lines per forced log flush; a crash loses at most BATCH_SIZE + FLUSH_EVERY lines
+    LOG_BUFFER_BYTES = 8192  # encoded bytes held before they are written to the log fd
+    BATCH_SIZE = 64  # trace lines queued before their ANSI codes are stripped and they go to the log buffer
+    MONITORING_TOOL_ID = 0  # sys.monitoring.DEBUGGER_ID
+
+    def __init__(self, config: TracerConfig):
+        super().__init__(config)
+        self._log_fd = None
+        self._log_buf = bytearray()
+        self._unflushed = 0  # trace lines in _log_buf
+        self._trace_buf = []
+        self._lock = threading.RLock()  # guards the three buffers above and the fd
+        self._code_cache = {}  # code object -> (shown path, func, lines) or None when skipped
+        self._tls = threading.local()  # per-thread depth of traced calls
+        self._monitoring = False
+        events = self.config.events
+        self._want_line = "line" in events
+        # Call/return alone can come from the profile hook, which never dispatches per line
+        self._profile_only = events <= {"call", "return"}
+        include = self.config.include_paths
+        self._include_re = re.compile("|".join(map(re.escape, include))) if include else None
+        self._precompute_colors()
+        self.trace = self._make_trace()  # Specialized for this config; replaces BaseTracer.trace
+        atexit.register(self.close)
+
+    def _precompute_colors(self):
+        """Build the color-wrapped constant fragments used by trace() once"""
+        color = self._color
+        self._c_call = color('╭▶', 'cyan', 'bold')
+        self._c_args = color('│ args:', 'yellow')
+        self._c_line = color('│ →', 'cyan')
+        self._c_locals = color('│ • locals:', 'gray')
+        self._c_ret = color('╰↩', 'green', 'bold')
+        self._c_return = color('return', 'gray')
+        self._c_exc = color('💥', 'red', 'bold')
+
+        # Opening codes for values wrapped per event; every wrap ends in _c_end
+        if self.config.use_color:
+            self._c_end = "\033[0m"
+            self._c_gray = "\033[90m"
+            self._c_blue = "\033[94m"
+            self._c_func = "\033[1m\033[92m"
+            self._c_text = "\033[0m"
+        else:
+            self._c_end = self._c_gray = self._c_blue = self._c_func = self._c_text = ""
+
+    def _open_log(self):
+        """Open the log file once, on first flush, as a raw append-only fd"""
+        self._log_fd = os.open(str(self.log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._log_fd
+
+    def _write(self, line, lines=1):
+        """Queue text holding `lines` trace lines for the log file, writing once enough has built up"""
+        with self._lock:
+            buf = self._log_buf
+            buf += line.encode("utf-8")
+            buf += b"\n"
+            self._unflushed += lines
+            if len(buf) >= self.LOG_BUFFER_BYTES or self._unflushed >= self.FLUSH_EVERY:
+                self._flush_log()
+
+    def _flush_log(self):
+        """Write the pending log bytes straight to the fd, bypassing the text I/O stack"""
+        with self._lock:
+            buf = self._log_buf
+            if buf:
+                fd = self._log_fd if self._log_fd is not None else self._open_log()
+                view = memoryview(buf)
+                while view:
+                    view = view[os.write(fd, view):]
+                view.release()
+                buf.clear()
+            self._unflushed = 0
+
+    def _log(self, line):
+        """Print a trace line now and queue its copy for the log file"""
+        sys.stdout.write(line + "\n")
+        with self._lock:
+            trace_buf = self._trace_buf
+            trace_buf.append(line)
+            if len(trace_buf) >= self.BATCH_SIZE:
+                self._flush_trace()
+
+    def _flush_trace(self):
+        """Strip the colors of all queued lines at once and pass them to the log buffer as one write"""
+        with self._lock:
+            trace_buf = self._trace_buf
+            if not trace_buf:
+                return
+            text = "\n".join(trace_buf)
+            lines = len(trace_buf)
+            trace_buf.clear()
+            self._write(self._plain(text), lines)
+
+    def close(self):
+        """Flush queued output and close the log file; runs on uninstall() and at interpreter exit"""
+        with self._lock:
+            self._flush_trace()
+            self._flush_log()
+            if self._log_fd is not None:
+                os.close(self._log_fd)
+                self._log_fd = None
+
+    def install(self):
+        """Start tracing the current thread"""
+        if self._install_monitoring():
+            return self
+        if self._profile_only:
+            sys.setprofile(self.trace)
+        else:
+            sys.settrace(self.trace)
+        return self
+
+    def uninstall(self):
+        """Stop tracing the current thread and flush what was collected"""
+        if self._monitoring:
+            self._uninstall_monitoring()
+        sys.setprofile(None)
+        sys.settrace(None)
+        self.close()
+
+    # === sys.monitoring (PEP 669, Python 3.12+) ===
+    def _install_monitoring(self):
+        """Route events through sys.monitoring when the interpreter has it"""
+        mon = getattr(sys, "monitoring", None)
+        if mon is None:
+            return False
+        try:
+            mon.use_tool_id(self.MONITORING_TOOL_ID, "neuro-os tracer")
+        except ValueError:
+            return False  # Tool id taken (e.g. by a debugger), fall back to settrace
+
+        E = mon.events
+        # Start/return events are always needed to keep the depth counter right
+        callbacks = {
+            E.PY_START: self._mon_call,
+            E.PY_RESUME: self._mon_call,
+            E.PY_THROW: self._mon_throw,
+            E.PY_RETURN: self._mon_return,
+            E.PY_YIELD: self._mon_return,
+            E.PY_UNWIND: self._mon_unwind,
+        }
+        if "exception" in self.config.events:
+            callbacks[E.RAISE] = self._mon_raise
+        if self._want_line:
+            callbacks[E.LINE] = self._mon_line
+
+        mask = 0
+        for event, callback in callbacks.items():
+            mon.register_callback(self.MONITORING_TOOL_ID, event, callback)
+            mask |= event
+        mon.set_events(self.MONITORING_TOOL_ID, mask)
+        self._monitoring = True
+        return True
+
+    def _uninstall_monitoring(self):
+        mon = sys.monitoring
+        mon.set_events(self.MONITORING_TOOL_ID, 0)
+        mon.free_tool_id(self.MONITORING_TOOL_ID)
+        self._monitoring = False
+
+    def _mon_event(self, code, event, arg):
+        """Feed a monitoring event to trace(); DISABLE it for code outside the project"""
+        try:
+            info = self._code_cache[code]
+        except KeyError:
+            info = self._code_cache[code] = self._classify(code)
+        if info is None:
+            return sys.monitoring.DISABLE
+        self.trace(sys._getframe(2), event, arg)
+
+    def _mon_call(self, code, offset):
+        return self._mon_event(code, "call", None)
+
+    def _mon_throw(self, code, offset, exc):
+        # Resuming by throw() is a call too, but PY_THROW can't be disabled, so never return DISABLE
+        self._mon_event(code, "call", None)
+
+    def _mon_return(self, code, offset, retval):
+        return self._mon_event(code, "return", retval)
+
+    def _mon_unwind(self, code, offset, exc):
+        # Matches settrace, which reports a frame left by an exception as returning None
+        self._mon_event(code, "return", None)
+
+    def _mon_raise(self, code, offset, exc):
+        self._mon_event(code, "exception", (type(exc), exc, exc.__traceback__))
+
+    def _mon_line(self, code, line):
+        return self._mon_event(code, "line", None)
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+
+    def _classify(self, code):
+        """Resolve a code object's project path once and decide whether it is traced"""
+        filename = Path(code.co_filename).resolve()
+        try:
+            rel = filename.relative_to(self.project_root)
+        except ValueError:
+            return None  # Skip non-project files
+
+        # Check include paths
+        rel_posix = rel.as_posix()
+        if self._include_re and not self._include_re.search(rel_posix):
+            return None
+
+        # Check excluded functions
+        if code.co_name in self.config.exclude_functions:
+            return None
+
+        # Source is read once per code object instead of through linecache per line event
+        lines = linecache.getlines(str(filename)) if self._want_line else ()
+        path = str(rel) if self.config.show_file_path else rel.name
+        return path, code.co_name, lines
+
+    def _make_trace(self):
+        """Build trace() as a closure with the (static) config and helpers bound as locals"""
+        cfg = self.config
+        events = frozenset(cfg.events)
+        want_call = "call" in events
+        want_line = self._want_line
+        max_value_len = cfg.max_value_len
+        max_locals = cfg.max_locals
+        max_stack_depth = cfg.max_stack_depth
+        show_timestamp = cfg.show_timestamp
+        start_time = self.start_time
+        perf_counter = time.perf_counter
+        code_cache = self._code_cache
+        classify = self._classify
+        tls = self._tls
+        log = self._log
+
+        c_call, c_args, c_line, c_locals = self._c_call, self._c_args, self._c_line, self._c_locals
+        c_ret, c_return, c_exc = self._c_ret, self._c_return, self._c_exc
+        end, gray, blue, c_func, c_text = self._c_end, self._c_gray, self._c_blue, self._c_func, self._c_text
+
+        # === HELPER FUNCTIONS ===
+        def short(v):
+            """Return a short string representation of a value."""
+            s = repr(v)
+            return s if len(s) <= max_value_len else s[:max_value_len - 3] + "..."
+
+        def fmt_locals(locals_dict):
+            """Return a string representation of local variables."""
+            if max_locals <= 0:
+                return ""
+            items = []
+            for k, v in locals_dict.items():
+                if k.startswith("__") or isinstance(v, FunctionType):
+                    continue
+                items.append(f"{blue}{k}{end}={gray}{short(v)}{end}")
+                if len(items) >= max_locals:
+                    break  # Only the first max_locals are shown, don't repr the rest
+            return ", ".join(items)
+
+        def trace(frame, event, arg):
+            """Trace function calls, returns, and exceptions."""
+            code = frame.f_code
+            try:
+                info = code_cache[code]
+            except KeyError:
+                info = code_cache[code] = classify(code)
+            if info is None:
+                return
+            path, func, lines = info
+
+            # Track call depth as a counter instead of rebuilding the stack per event
+            depth = getattr(tls, "depth", 0)
+            if event == "call":
+                if not want_call:
+                    return
+                tls.depth = depth + 1
+            elif event == "return":
+                tls.depth = depth = max(0, depth - 1)
+            else:
+                depth = max(0, depth - 1)  # line/exception belong to the frame's own call depth
+
+            # Check events
+            if event not in events:
+                return
+
+            indent = "│  " * (depth % max_stack_depth)
+            ts = f"[{(perf_counter() - start_time):6.3f}s]" if show_timestamp else ""
+
+            # === CALL ===
+            if event == "call":
+                # Same names inspect.getargvalues() reports, read straight off the code object
+                args = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+                values = frame.f_locals
+                arg_str = ", ".join(f"{a}={short(values[a])}" for a in args if a in values)
+                log(f"\n{indent}{c_call} {c_func}{func}{end}() {gray}{path}:{frame.f_lineno}{end} {ts}")
+                if arg_str:
+                    log(f"{indent}{c_args} {arg_str}")
+                if not want_line:
+                    frame.f_trace_lines = False  # Still get return/exception, but no per-line dispatch
+
+            # === LINE ===
+            elif event == "line":
+                lineno = frame.f_lineno
+                line = lines[lineno - 1].strip() if 0 < lineno <= len(lines) else ""
+                log(f"{indent}{c_line} {c_text}{line}{end}")
+                local_vars = fmt_locals(frame.f_locals)
+                if local_vars:
+                    log(f"{indent}{c_locals} {local_vars}")
+
+            # === RETURN ===
+            elif event == "return":
+                log(f"{indent}{c_ret} {c_return} {short(arg)} {ts}")
+
+            # === EXCEPTION ===
+            elif event == "exception":
+                exc_type, exc_value, _ = arg
+                log(f"{indent}{c_exc} {exc_type.__name__}: {exc_value}  {gray}{path}:{frame.f_lineno}{end}")
+
+            return trace
+
+        return trace
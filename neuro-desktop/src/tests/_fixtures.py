@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the neuro-os test scripts
+"""
+import importlib.util
+from functools import lru_cache
+
+import pytest
+
+def require(*names):
+    """Skip the calling test if any of the modules isn't installed
+
+    Only find_spec() returning None counts as missing: the top-level package is looked up
+    first, then the module itself. find_spec imports the parent packages on the way, and an
+    error raised while doing that propagates, so a broken import fails the test instead of
+    being reported as a skip. Names are checked in order, so list third-party dependencies
+    before the project modules that import them.
+    """
+    find_spec = importlib.util.find_spec
+    for name in names:
+        if find_spec(name.partition(".")[0]) is None or find_spec(name) is None:
+            pytest.skip(f"missing {name}")
+
+@lru_cache(maxsize=1)
+def get_core():
+    """The RegionalizationCore shared by every test in this process, built on first use"""
+    from src.dev.integration.regionalization.core import RegionalizationCore
+    return RegionalizationCore()
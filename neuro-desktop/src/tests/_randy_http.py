@@ -0,0 +1,44 @@
+"""
+Shared HTTP helper for the Randy test scripts
+"""
+import asyncio
+import logging
+import time
+
+import orjson
+import requests
+
+logger = logging.getLogger(__name__)
+
+RANDY_HTTP_URL = "http://localhost:1337/"
+
+# One keep-alive connection to Randy for every action, across all test scripts in the process
+SESSION = requests.Session()
+SESSION.headers['Content-Type'] = 'application/json'
+
+async def send_action_to_randy(action_name, action_data=None, session=SESSION):
+    """Send an action to Randy via HTTP API (the blocking request runs in a worker thread)
+
+    Returns (success, response text or error message).
+    """
+    payload = {
+        "command": "action",
+        "data": {
+            "id": f"test_{int(time.time())}",
+            "name": action_name,
+            "data": orjson.dumps(action_data or {}).decode()
+        }
+    }
+    
+    try:
+        response = await asyncio.to_thread(
+            session.post,
+            RANDY_HTTP_URL,
+            data=orjson.dumps(payload),  # Content-Type is set on the session
+            timeout=(3.0, 5.0)  # (connect, read)
+        )
+        logger.info(f"Sent action '{action_name}' to Randy: {response.status_code}")
+        return response.status_code == 200, response.text
+    except Exception as e:
+        logger.error(f"Failed to send action to Randy: {e}")
+        return False, str(e)
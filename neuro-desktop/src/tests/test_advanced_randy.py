@@ -4,55 +4,28 @@ Tests clicking on actual detected regions and monitoring system state changes
 """
 
 import asyncio
-import requests
-import json
 import logging
-import time
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parents[2]))
 
-from src.regionalization.core import RegionalizationCore
+from _fixtures import get_core
+from _randy_http import send_action_to_randy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-RANDY_HTTP_URL = "http://localhost:1337/"
-
-def send_action_to_randy(action_name, action_data=None):
-    """Send an action to Randy via HTTP API"""
-    payload = {
-        "command": "action",
-        "data": {
-            "id": f"neuro_test_{int(time.time())}",
-            "name": action_name,
-            "data": json.dumps(action_data or {})
-        }
-    }
-    
-    try:
-        response = requests.post(
-            RANDY_HTTP_URL,
-            headers={'Content-Type': 'application/json'},
-            json=payload,
-            timeout=5
-        )
-        return response.status_code == 200, response.text
-    except Exception as e:
-        logger.error(f"Failed to send action to Randy: {e}")
-        return False, str(e)
-
 async def test_realistic_interactions():
     """Test realistic interactions using actual detected regions"""
     
     logger.info("🧠 Advanced Randy Integration Test - Simulating Neuro Behavior")
     logger.info("=" * 60)
     
-    # Initialize regionalization core
-    core = RegionalizationCore()
+    # Shared regionalization core (built once per process)
+    core = get_core()
     await core.force_update()
     state = core.get_current_state()
     
@@ -60,9 +33,12 @@ async def test_realistic_interactions():
         logger.error("No system state available")
         return
     
+    # Filter the window regions once; the log line and the click target both use them
+    windows = tuple(r for r in state.all_regions if r.region_type.value == 'window')
+    
     logger.info(f"📊 System Analysis:")
     logger.info(f"   Active Application: {state.active_application}")
-    logger.info(f"   Detected Windows: {len([r for r in state.all_regions if r.region_type.value == 'window'])}")
+    logger.info(f"   Detected Windows: {len(windows)}")
     logger.info(f"   Total Regions: {len(state.all_regions)}")
     logger.info(f"   Available Actions: {len(state.available_actions)}")
     
@@ -71,7 +47,7 @@ async def test_realistic_interactions():
     
     # Test 1: Take screenshot to see current state
     logger.info(f"\n🔍 Test 1: Taking screenshot to analyze current state...")
-    success, response = send_action_to_randy("screenshot", {})
+    success, response = await send_action_to_randy("screenshot", {})
     if success:
         logger.info("✅ Screenshot command sent successfully")
     else:
@@ -80,7 +56,7 @@ async def test_realistic_interactions():
     await asyncio.sleep(2)
     
     # Test 2: Click on a specific detected region
-    clickable_regions = [r for r in state.all_regions if r.clickable and r.region_type.value == 'window']
+    clickable_regions = tuple(r for r in windows if r.clickable)
     
     if clickable_regions:
         target_region = clickable_regions[0]  # Click on first clickable window
@@ -91,7 +67,7 @@ async def test_realistic_interactions():
         logger.info(f"   Target coordinates: ({click_x}, {click_y})")
         logger.info(f"   Region type: {target_region.region_type.value}")
         
-        success, response = send_action_to_randy("click", {"x": click_x, "y": click_y})
+        success, response = await send_action_to_randy("click", {"x": click_x, "y": click_y})
         if success:
             logger.info("✅ Click command sent successfully")
             
@@ -101,7 +77,9 @@ async def test_realistic_interactions():
             new_state = core.get_current_state()
             
             if new_state and new_state.focused_region:
-                if new_state.focused_region.id != state.focused_region.id if state.focused_region else True:
+                # Window regions carry their integer hwnd; compare that rather than the id strings
+                prev_hwnd = state.focused_region.metadata.get("hwnd") if state.focused_region else None
+                if new_state.focused_region.metadata.get("hwnd") != prev_hwnd:
                     logger.info(f"🔄 Focus changed to: {new_state.focused_region.title}")
                 else:
                     logger.info("🔄 Focus remained the same")
@@ -112,7 +90,7 @@ async def test_realistic_interactions():
     
     # Test 3: Simulate keyboard interaction
     logger.info(f"\n⌨️ Test 3: Simulating keyboard shortcut (Alt+Tab)")
-    success, response = send_action_to_randy("hotkey", {"keys": ["alt", "tab"]})
+    success, response = await send_action_to_randy("hotkey", {"keys": ["alt", "tab"]})
     if success:
         logger.info("✅ Alt+Tab hotkey sent successfully")
         
@@ -137,7 +115,7 @@ async def test_realistic_interactions():
     context_data = {
         "timestamp": final_state.timestamp.isoformat(),
         "active_app": final_state.active_application,
-        "window_count": len([r for r in final_state.all_regions if r.region_type.value == 'window']),
+        "window_count": sum(1 for r in final_state.all_regions if r.region_type.value == 'window'),
         "focused_window": {
             "title": final_state.focused_region.title if final_state.focused_region else None,
             "bounds": {
@@ -155,7 +133,7 @@ async def test_realistic_interactions():
     }
     
     # This would normally be sent via WebSocket, but we'll use HTTP for testing
-    success, response = send_action_to_randy("context_update", context_data)
+    success, response = await send_action_to_randy("context_update", context_data)
     if success:
         logger.info("✅ Context data sent successfully")
     else:
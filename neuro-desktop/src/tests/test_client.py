@@ -0,0 +1,172 @@
+"""
+Tests for NeuroClient's outbound path to the Neuro backend
+"""
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from _fixtures import require
+
+@pytest.fixture
+def client_cls():
+    require("neuro_api.api", "websockets", "src.dev.integration.client")
+    from src.dev.integration.client import NeuroClient
+    return NeuroClient
+
+class FakeWebSocket:
+    """Records the frames sent to it; once closed, send() raises ConnectionClosed like a dropped link"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    async def send(self, data):
+        if self.closed:
+            import websockets
+            raise websockets.exceptions.ConnectionClosed(None, None)
+        self.sent.append(data)
+
+def make_client(client_cls, websocket):
+    client = client_cls(websocket)
+    client._reg = None  # no regionalization; tests drive the client directly
+    return client
+
+async def test_writer_restarts_after_connection_closed(client_cls):
+    ws = FakeWebSocket()
+    client = make_client(client_cls, ws)
+
+    await client.write_to_websocket("a")
+    await client._out_q.join()
+    assert ws.sent == ["a"]
+
+    # A closed connection ends the writer and drops the queue instead of leaving it to fill up
+    ws.closed = True
+    await asyncio.wait_for(
+        asyncio.gather(*(client.write_to_websocket(str(i)) for i in range(300))), timeout=2
+    )
+    await client._out_q.join()
+    assert client._writer_task is None
+    assert client._out_q.empty()
+
+    # The next write starts a new writer, which sends on the current websocket
+    client.websocket = reconnected = FakeWebSocket()
+    await client.write_to_websocket("b")
+    await client._out_q.join()
+    assert reconnected.sent == ["b"]
+    await client.close()
+
+async def test_writer_survives_unexpected_send_error(client_cls):
+    class FailingWebSocket(FakeWebSocket):
+        async def send(self, data):
+            raise RuntimeError("boom")
+
+    client = make_client(client_cls, FailingWebSocket())
+    await client.write_to_websocket("a")
+    await client._out_q.join()
+    assert client._writer_task is None
+
+    client.websocket = ws = FakeWebSocket()
+    await client.write_to_websocket("b")
+    await client._out_q.join()
+    assert ws.sent == ["b"]
+    await client.close()
+
+def context_messages(ws):
+    """The message text of every context frame sent"""
+    import orjson
+    return [orjson.loads(frame)["data"]["message"] for frame in ws.sent]
+
+async def test_context_debounce_coalesces_bursts(client_cls):
+    ws = FakeWebSocket()
+    client = make_client(client_cls, ws)
+    client.CONTEXT_MIN_INTERVAL = 0.05
+
+    # Leading edge: the first message goes out at once
+    assert await client._send_context_debounced("first") is True
+    # A burst inside the window is held back; only its newest message is sent, once
+    for i in range(10):
+        assert await client._send_context_debounced(f"burst {i}") is False
+    assert client._pending_ctx_task is not None
+    await asyncio.sleep(0.15)
+    await client._out_q.join()
+
+    assert context_messages(ws) == ["first", "burst 9"]
+    assert client._pending_ctx_task is None
+    await client.close()
+
+async def test_context_debounce_waits_for_idle_and_cancels_on_close(client_cls):
+    ws = FakeWebSocket()
+    client = make_client(client_cls, ws)
+    client.CONTEXT_MIN_INTERVAL = 0.05
+
+    await client._send_context_debounced("first")
+    client._idle.clear()  # Neuro is waiting on an action result
+    await client._send_context_debounced("held")
+    await asyncio.sleep(0.1)
+    await client._out_q.join()
+    assert context_messages(ws) == ["first"]
+
+    task = client._pending_ctx_task
+    await client.close()
+    await asyncio.sleep(0)
+    assert task.cancelled()
+
+class FakeRegionalization:
+    """The slice of RegionalizationCore the publish loop reads: a state event and a context message"""
+
+    def __init__(self, message):
+        from types import SimpleNamespace
+        self.state_changed = asyncio.Event()
+        self.message = message
+        self.state = SimpleNamespace(all_regions=[])
+
+    def publish(self, message):
+        """A new state: new message, and the core signals the change"""
+        self.message = message
+        self.state_changed.set()
+
+    def get_current_state(self):
+        return self.state
+
+    def get_context_message(self):
+        return self.message
+
+    def get_ocr_elements(self):
+        return []
+
+async def test_publish_loop_sends_on_change_and_keepalive(client_cls):
+    ws = FakeWebSocket()
+    client = make_client(client_cls, ws)
+    client.CONTEXT_MIN_INTERVAL = 0  # no debounce; this test is about when the loop sends
+    client.CONTEXT_KEEPALIVE = 0.3
+    client._reg = reg = FakeRegionalization("state 1")
+    loop_task = asyncio.create_task(client._publish_context_loop())
+    try:
+        # t=0: a new state is sent right away
+        reg.publish("state 1")
+        await asyncio.sleep(0.05)
+        assert context_messages(ws) == ["state 1"]
+
+        # t=0.3: the keep-alive rebuilds the message, but an identical one is not resent
+        await asyncio.sleep(0.35)
+        assert context_messages(ws) == ["state 1"]
+
+        # t=0.4: the live part of the message changes without a state change
+        reg.message = "state 1, mouse moved"
+        await asyncio.sleep(0.05)
+        assert context_messages(ws) == ["state 1"]  # nothing until the keep-alive...
+        await asyncio.sleep(0.25)
+        assert context_messages(ws) == ["state 1", "state 1, mouse moved"]  # ...which sends it (t=0.6)
+
+        # t=0.7: a state change goes out immediately, not on the keep-alive
+        reg.publish("state 2")
+        await asyncio.sleep(0.05)
+        assert context_messages(ws) == ["state 1", "state 1, mouse moved", "state 2"]
+    finally:
+        loop_task.cancel()
+        await client.close()
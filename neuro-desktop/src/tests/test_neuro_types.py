@@ -0,0 +1,339 @@
+"""
+Tests for the region query structures and the plugin registry in neuro_types
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from _fixtures import require
+from src.types.neuro_types import (
+    BoundingBox, Coordinates, RegionType, ScreenRegion, SystemState, REGION_TYPES,
+    PluginMetadata, PluginRegistry, PluginType,
+)
+
+def region(id, x, y, width, height, region_type=RegionType.WINDOW, **kwargs):
+    return ScreenRegion(id=id, region_type=region_type, bounds=BoundingBox(x, y, width, height),
+                        confidence=1.0, **kwargs)
+
+def state_of(regions):
+    return SystemState(active_application=None, focused_region=None, all_regions=regions,
+                       context_data=[], available_actions=[], timestamp=datetime.now())
+
+def ids(regions):
+    return [r.id for r in regions]
+
+# === RegionArray / SystemState.region_array ===
+
+@pytest.fixture
+def np():
+    require("numpy")
+    import numpy
+    return numpy
+
+def test_region_array_columns(np):
+    regions = [
+        region("a", 0, 0, 100, 50, clickable=True, focusable=True),
+        region("b", 10, 20, 30, 40, RegionType.BUTTON, clickable=True, enabled=False),
+        region("c", -5, 7, 1, 2, RegionType.INPUT_FIELD, focusable=True, visible=False),
+    ]
+    array = state_of(regions).region_array()
+
+    assert len(array) == 3
+    assert array.xs.tolist() == [0, 10, -5]
+    assert array.ys.tolist() == [0, 20, 7]
+    assert array.ws.tolist() == [100, 30, 1]
+    assert array.hs.tolist() == [50, 40, 2]
+    assert array.ids.tolist() == ["a", "b", "c"]
+    assert [REGION_TYPES[code] for code in array.region_types] == [
+        RegionType.WINDOW, RegionType.BUTTON, RegionType.INPUT_FIELD]
+    assert array.flags.tolist() == [r.flags for r in regions]
+
+    assert array.count_by_type() == {RegionType.WINDOW: 1, RegionType.BUTTON: 1, RegionType.INPUT_FIELD: 1}
+    assert ids(array.select(array.of_type(RegionType.BUTTON))) == ["b"]
+    assert ids(array.select(array.with_flags(ScreenRegion.CLICKABLE))) == ["a", "b"]
+    assert ids(array.select(array.with_flags(ScreenRegion.CLICKABLE | ScreenRegion.ENABLED))) == ["a"]
+    assert ids(array.select(array.with_flags(ScreenRegion.VISIBLE))) == ["a", "b"]
+    # Same inclusive edges as BoundingBox.contains / overlaps
+    assert ids(array.select(array.hit_test(Coordinates(40, 60)))) == ["b"]
+    assert ids(array.select(array.hit_test(Coordinates(100, 50)))) == ["a"]
+    assert ids(array.select(array.overlaps_all(-10, 0, 10, 10))) == ["a", "c"]
+    assert [r.bounds.overlaps(BoundingBox(-10, 0, 10, 10)) for r in regions] == [True, False, True]
+
+def test_region_array_empty_state(np):
+    array = state_of([]).region_array()
+
+    assert len(array) == 0
+    for column in (array.xs, array.ys, array.ws, array.hs, array.ids, array.region_types, array.flags):
+        assert column.shape == (0,)
+    assert array.count_by_type() == {}
+    assert array.select(array.hit_test(Coordinates(0, 0))) == []
+    assert array.select(array.overlaps_all(0, 0, 10, 10)) == []
+
+def test_region_array_cache(np):
+    state = state_of([region("a", 0, 0, 10, 10), region("b", 20, 0, 10, 10)])
+    array = state.region_array()
+    assert state.region_array() is array
+
+    # A replaced region list is picked up
+    state.all_regions = [region("c", 50, 50, 10, 10)]
+    assert state.region_array().ids.tolist() == ["c"]
+
+    # So is an in-place edit that changes the count
+    state.all_regions.append(region("d", 0, 0, 1, 1))
+    assert state.region_array().ids.tolist() == ["c", "d"]
+
+    # Same-length in-place edits need invalidate_regions()
+    state.all_regions[0] = region("e", 0, 0, 1, 1)
+    assert state.region_array().ids.tolist() == ["c", "d"]
+    state.invalidate_regions()
+    assert state.region_array().ids.tolist() == ["e", "d"]
+
+# === RegionGrid / SystemState.regions_at / regions_overlapping ===
+
+def brute_at(regions, point):
+    return [r.id for r in regions if r.bounds.contains(point)]
+
+def brute_overlapping(regions, box):
+    return [r.id for r in regions if r.bounds.overlaps(box)]
+
+def test_region_grid_cell_edges():
+    regions = [
+        region("a", 0, 0, 256, 10),  # right edge (inclusive) lies exactly on the first cell boundary
+        region("b", 256, 0, 10, 10),  # starts on it
+        region("c", 257, 0, 10, 10),
+        region("d", 0, 255, 10, 1),  # bottom edge on the boundary
+    ]
+    state = state_of(regions)
+
+    assert ids(state.regions_at(Coordinates(255, 5))) == ["a"]
+    assert ids(state.regions_at(Coordinates(256, 5))) == ["a", "b"]
+    assert ids(state.regions_at(Coordinates(257, 5))) == ["b", "c"]
+    assert ids(state.regions_at(Coordinates(5, 256))) == ["d"]
+    assert ids(state.regions_at(Coordinates(5, 257))) == []
+    assert ids(state.regions_overlapping(BoundingBox(250, 0, 6, 1))) == ["a", "b"]
+    assert ids(state.regions_overlapping(BoundingBox(0, 256, 1, 1))) == ["d"]
+
+def test_region_grid_negative_coordinates():
+    regions = [
+        region("left", -300, -20, 100, 40),  # cells x -2..-1, y -1..0
+        region("origin", -10, -10, 20, 20),  # the four cells around (0, 0)
+        region("far", -1024, -1024, 1, 1),
+    ]
+    state = state_of(regions)
+
+    assert ids(state.regions_at(Coordinates(-250, 0))) == ["left"]
+    assert ids(state.regions_at(Coordinates(-1, -1))) == ["origin"]
+    assert ids(state.regions_at(Coordinates(10, 10))) == ["origin"]
+    assert ids(state.regions_at(Coordinates(-1023, -1023))) == ["far"]
+    assert ids(state.regions_overlapping(BoundingBox(-400, -400, 390, 390))) == ["left", "origin"]
+
+    # Same answers as a linear scan, across cell boundaries on both sides of the origin
+    coords = sorted({c + d for c in range(-512, 513, 256) for d in (-1, 0, 1)} | {-300, -200, -10, 10})
+    for x in coords:
+        for y in coords:
+            assert ids(state.regions_at(Coordinates(x, y))) == brute_at(regions, Coordinates(x, y))
+
+def test_region_grid_multi_cell_regions_are_reported_once():
+    regions = [
+        region("desktop", 0, 0, 1920, 1080),  # listed under 8 x 5 cells
+        region("button", 300, 300, 20, 20),
+        region("panel", 200, 200, 400, 400),  # 3 x 3 cells
+    ]
+    state = state_of(regions)
+
+    box = BoundingBox(0, 0, 1000, 1000)
+    assert ids(state.regions_overlapping(box)) == ["desktop", "button", "panel"]
+    assert ids(state.regions_at(Coordinates(310, 310))) == ["desktop", "button", "panel"]
+    assert ids(state.regions_at(Coordinates(1900, 1000))) == ["desktop"]
+    for box in (BoundingBox(250, 250, 300, 300), BoundingBox(1500, 0, 1000, 2000), BoundingBox(700, 700, 1, 1)):
+        assert ids(state.regions_overlapping(box)) == brute_overlapping(regions, box)
+
+# === PluginRegistry ===
+
+def metadata(name, plugin_type=PluginType.REGION_DETECTOR, apps=(), enabled=True):
+    return PluginMetadata(name=name, version="1.0", author="tests", description=name,
+                          plugin_type=plugin_type, supported_apps=list(apps), enabled=enabled)
+
+class Plugin:
+    """Implements every PLUGIN_ENTRY_POINTS method, answering with its own name"""
+
+    def __init__(self, name):
+        self.name = name
+
+    async def detect_regions(self, screenshot, context):
+        return self.name
+
+    async def extract_context(self, regions, app_name):
+        return self.name
+
+    async def execute_action(self, action):
+        return self.name
+
+    async def get_app_context(self, app_name):
+        return self.name
+
+def register(registry, name, plugin_type=PluginType.REGION_DETECTOR, apps=(), enabled=True):
+    plugin = Plugin(name)
+    registry.register_plugin(plugin, metadata(name, plugin_type, apps, enabled))
+    return plugin
+
+def assert_indexes_consistent(registry):
+    """_by_type / _by_app name exactly the registered plugins, under their current metadata"""
+    by_type, by_app = {}, {}
+    for name, meta in registry.metadata.items():
+        by_type.setdefault(meta.plugin_type, []).append(name)
+        for app in meta.supported_apps:
+            by_app.setdefault(app, []).append(name)
+    normalize = lambda index: {key: sorted(names) for key, names in index.items()}
+    assert normalize(registry._by_type) == normalize(by_type)
+    assert normalize(registry._by_app) == normalize(by_app)
+    assert set(registry.plugins) | set(registry._factories) == set(registry.metadata)
+
+def test_registry_lookup_by_type_and_app():
+    registry = PluginRegistry()
+    chrome = register(registry, "chrome", PluginType.REGION_DETECTOR, ["chrome.exe"])
+    office = register(registry, "office", PluginType.REGION_DETECTOR, ["winword.exe", "excel.exe"])
+    context = register(registry, "context", PluginType.CONTEXT_PROVIDER, ["chrome.exe"])
+    assert_indexes_consistent(registry)
+
+    assert registry.get_plugins_by_type(PluginType.REGION_DETECTOR) == [chrome, office]
+    assert registry.get_plugins_by_type(PluginType.CONTEXT_PROVIDER) == [context]
+    assert registry.get_plugins_by_type(PluginType.ACTION_HANDLER) == []
+    assert registry.get_plugins_for_app("chrome.exe") == [chrome, context]
+    assert registry.get_plugins_for_app("excel.exe") == [office]
+    assert registry.get_plugins_for_app("notepad.exe") == []
+
+    # Disabling after registration takes effect on the next lookup
+    registry.metadata["chrome"].enabled = False
+    assert registry.get_plugins_for_app("chrome.exe") == [context]
+
+def test_registry_unregister_keeps_indexes_consistent():
+    registry = PluginRegistry()
+    register(registry, "chrome", PluginType.REGION_DETECTOR, ["chrome.exe"])
+    office = register(registry, "office", PluginType.REGION_DETECTOR, ["winword.exe", "chrome.exe"])
+    register(registry, "context", PluginType.CONTEXT_PROVIDER, ["excel.exe"])
+
+    registry.unregister_plugin("chrome")
+    assert_indexes_consistent(registry)
+    assert registry.get_plugins_by_type(PluginType.REGION_DETECTOR) == [office]
+    assert registry.get_plugins_for_app("chrome.exe") == [office]
+
+    # The last plugin of a type or app takes its index entry with it
+    registry.unregister_plugin("context")
+    assert_indexes_consistent(registry)
+    assert PluginType.CONTEXT_PROVIDER not in registry._by_type
+    assert "excel.exe" not in registry._by_app
+    assert registry.get_plugins_for_app("excel.exe") == []
+
+    registry.unregister_plugin("missing")  # unknown names are ignored
+    registry.unregister_plugin("office")
+    assert_indexes_consistent(registry)
+    assert registry._by_type == {} and registry._by_app == {}
+
+def test_registry_reregister_moves_plugin_between_indexes():
+    registry = PluginRegistry()
+    register(registry, "tool", PluginType.REGION_DETECTOR, ["a.exe"])
+    tool = register(registry, "tool", PluginType.ACTION_HANDLER, ["b.exe"])
+    assert_indexes_consistent(registry)
+
+    assert registry.get_plugins_by_type(PluginType.REGION_DETECTOR) == []
+    assert registry.get_plugins_by_type(PluginType.ACTION_HANDLER) == [tool]
+    assert registry.get_plugins_for_app("a.exe") == []
+    assert registry.get_plugins_for_app("b.exe") == [tool]
+
+def test_plugin_type_keeps_string_values():
+    # Configs and serialized metadata carry these strings
+    assert [t.value for t in PluginType] == ["region_detector", "context_provider", "action_handler", "app_integration"]
+    assert PluginType("action_handler") is PluginType.ACTION_HANDLER
+    assert [t.rank for t in PluginType] == [0, 1, 2, 3]
+
+class CountingFactory:
+    """Lazy plugin factory that records how often it was called"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return Plugin(self.name)
+
+def test_registry_lazy_factory_runs_once():
+    registry = PluginRegistry()
+    factory = CountingFactory("lazy")
+    registry.register_lazy(metadata("lazy", PluginType.CONTEXT_PROVIDER, ["app.exe"]), factory)
+    assert factory.calls == 0
+    assert_indexes_consistent(registry)
+
+    plugin, = registry.get_plugins_by_type(PluginType.CONTEXT_PROVIDER)
+    assert plugin.name == "lazy"
+    assert registry.get_plugins_for_app("app.exe") == [plugin]
+    assert [h.__self__ for h in registry.get_handlers(PluginType.CONTEXT_PROVIDER)] == [plugin]
+    assert factory.calls == 1
+    assert "lazy" not in registry._factories
+
+    # Unregistered before it was ever built: the factory never runs
+    unused = CountingFactory("unused")
+    registry.register_lazy(metadata("unused"), unused)
+    registry.unregister_plugin("unused")
+    assert registry.get_plugins_by_type(PluginType.REGION_DETECTOR) == []
+    assert unused.calls == 0
+    assert_indexes_consistent(registry)
+
+async def test_registry_preload_all_builds_each_plugin_once():
+    registry = PluginRegistry()
+    factories = [CountingFactory(f"lazy{i}") for i in range(3)]
+    for factory in factories:
+        registry.register_lazy(metadata(factory.name), factory)
+    eager = register(registry, "eager")
+
+    await registry.preload_all()
+    assert [f.calls for f in factories] == [1, 1, 1]
+    assert registry._factories == {}
+
+    plugins = registry.get_plugins_by_type(PluginType.REGION_DETECTOR)
+    assert [p.name for p in plugins] == ["lazy0", "lazy1", "lazy2", "eager"] and plugins[-1] is eager
+    await registry.preload_all()  # nothing left to build
+    assert [f.calls for f in factories] == [1, 1, 1]
+
+async def test_registry_dispatch_table_is_cached_and_invalidated():
+    registry = PluginRegistry()
+    register(registry, "first")
+    register(registry, "context", PluginType.CONTEXT_PROVIDER)
+
+    handlers = registry.get_handlers(PluginType.REGION_DETECTOR)
+    assert [await handler(b"", {}) for handler in handlers] == ["first"]
+    table = registry._dispatch[PluginType.REGION_DETECTOR]
+    registry.get_handlers(PluginType.REGION_DETECTOR)
+    assert registry._dispatch[PluginType.REGION_DETECTOR] is table  # reused, not rebuilt
+
+    # Another type's (un)registration leaves this table alone
+    register(registry, "handler", PluginType.ACTION_HANDLER)
+    registry.unregister_plugin("context")
+    assert registry._dispatch[PluginType.REGION_DETECTOR] is table
+
+    # Registering or unregistering a plugin of the type rebuilds it
+    second_factory = CountingFactory("second")
+    registry.register_lazy(metadata("second"), second_factory)
+    assert PluginType.REGION_DETECTOR not in registry._dispatch
+    assert [h.__self__.name for h in registry.get_handlers(PluginType.REGION_DETECTOR)] == ["first", "second"]
+    assert second_factory.calls == 1
+
+    registry.unregister_plugin("first")
+    assert PluginType.REGION_DETECTOR not in registry._dispatch
+    assert [h.__self__.name for h in registry.get_handlers(PluginType.REGION_DETECTOR)] == ["second"]
+
+    # Re-registering a name replaces its handler
+    replacement = register(registry, "second")
+    assert [h.__self__ for h in registry.get_handlers(PluginType.REGION_DETECTOR)] == [replacement]
+
+    # enabled is read per call, without a rebuild
+    table = registry._dispatch[PluginType.REGION_DETECTOR]
+    registry.metadata["second"].enabled = False
+    assert registry.get_handlers(PluginType.REGION_DETECTOR) == []
+    assert registry._dispatch[PluginType.REGION_DETECTOR] is table
@@ -6,8 +6,8 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parents[2]))
 
 async def test_pagination():
     print("Testing Pagination Implementation\n")
@@ -39,8 +39,8 @@ async def test_pagination():
     # Test 2: Import regionalization
     print("\n[Test 2] Testing regionalization import...")
     try:
-        from src.regionalization.core import RegionalizationCore
-        from src.regionalization.ocr_detector import OCRDetector
+        from src.dev.integration.regionalization.core import RegionalizationCore
+        from src.dev.integration.regionalization.ocr_detector import OCRDetector
         print("✓ RegionalizationCore imported")
         print("✓ OCRDetector imported")
     except Exception as e:
@@ -3,58 +3,29 @@ Test script to trigger Randy actions via HTTP API and test neuro-os response
 """
 
 import asyncio
-import requests
-import json
 import logging
-import time
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parents[2]))
 
-from src.regionalization.core import RegionalizationCore
+from _fixtures import get_core
+from _randy_http import send_action_to_randy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-RANDY_HTTP_URL = "http://localhost:1337/"
 RANDY_WS_URL = "ws://localhost:8000"
 
-def send_action_to_randy(action_name, action_data=None):
-    """Send an action to Randy via HTTP API"""
-    payload = {
-        "command": "action",
-        "data": {
-            "id": f"test_{int(time.time())}",
-            "name": action_name,
-            "data": json.dumps(action_data or {})
-        }
-    }
-    
-    try:
-        response = requests.post(
-            RANDY_HTTP_URL,
-            headers={'Content-Type': 'application/json'},
-            json=payload,
-            timeout=5
-        )
-        logger.info(f"Sent action '{action_name}' to Randy: {response.status_code}")
-        if response.text:
-            logger.info(f"Randy response: {response.text}")
-        return response.status_code == 200
-    except Exception as e:
-        logger.error(f"Failed to send action to Randy: {e}")
-        return False
-
 async def test_randy_integration():
     """Test the full integration by triggering Randy actions"""
     
     logger.info("Testing Randy integration with enhanced regionalization system...")
     
-    # Initialize regionalization core
-    core = RegionalizationCore()
+    # Shared regionalization core (built once per process)
+    core = get_core()
     await core.force_update()
     state = core.get_current_state()
     
@@ -82,7 +53,9 @@ async def test_randy_integration():
         logger.info(f"\n--- Testing {action_name} action ---")
         
         # Send action to Randy
-        success = send_action_to_randy(action_name, action_data)
+        success, response = await send_action_to_randy(action_name, action_data)
+        if response:
+            logger.info(f"Randy response: {response}")
         
         if success:
             logger.info(f"✅ Successfully sent {action_name} to Randy")
@@ -8,10 +8,10 @@ import logging
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parents[2]))
 
-from src.regionalization.core import RegionalizationCore, WindowDetector
+from src.dev.integration.regionalization.core import RegionalizationCore, WindowDetector
 from src.types.neuro_types import PluginRegistry
 
 # Configure logging
@@ -0,0 +1,230 @@
+"""
+Smoke tests for neuro-os; independent, so they can run in parallel (pytest -n auto)
+"""
+import sys
+from pathlib import Path
+import json
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from _fixtures import require
+
+@pytest.fixture(scope="module")
+def dashboard_client():
+    require("src.admin.dashboard")
+    from src.admin.dashboard import app
+    return app.test_client()
+
+# 1) Test NeuroMessageBuilder and types
+def test_message_builder():
+    require("src.types.neuro_types")
+    from src.types.neuro_types import (
+        NeuroMessageBuilder, RegionType,
+        ScreenRegion, BoundingBox, SystemState, ContextData,
+        ContextType, Priority
+    )
+    from datetime import datetime
+
+    # Build a minimal fake state
+    window = ScreenRegion(
+        id="window_1",
+        region_type=RegionType.WINDOW,
+        bounds=BoundingBox(x=10, y=20, width=800, height=600),
+        confidence=0.95,
+        title="Test App",
+        application="test.exe",
+        clickable=True,
+        focusable=True,
+        metadata={"focused": True}
+    )
+
+    state = SystemState(
+        active_application="test.exe",
+        focused_region=window,
+        all_regions=[window],
+        context_data=[ContextData(
+            context_type=ContextType.SYSTEM_STATE,
+            timestamp=datetime.now(),
+            data={"note": "smoke test"},
+            confidence=0.9,
+            source="smoke",
+            priority=Priority.MEDIUM
+        )],
+        available_actions=[],
+        timestamp=datetime.now()
+    )
+
+    builder = NeuroMessageBuilder()
+    builder.update_state(state)
+    msg = builder.build_context_message()
+    print("- Context message length:", len(msg))
+    assert "Active Application: test.exe" in msg
+    assert "Screen Regions (1 total):" in msg
+    assert "Focused Window: Test App (window)" in msg
+    assert "  Center: (410, 320)" in msg
+    assert "1. Test App [FOCUSED]" in msg
+    assert "  - system_state: 1 items" in msg
+    print("OK: NeuroMessageBuilder built a message.")
+
+# 2) Test the client-side pagination over the cached context (get_more_text / get_more_windows)
+class _PaginationSource:
+    """Stands in for RegionalizationCore: a fixed state and OCR result"""
+
+    def __init__(self, state, ocr_elements):
+        self.state = state
+        self.ocr_elements = ocr_elements
+
+    def get_current_state(self):
+        return self.state
+
+    def get_ocr_elements(self):
+        return self.ocr_elements
+
+def test_context_pagination():
+    require(
+        "neuro_api.api",
+        "websockets",
+        "src.dev.integration.client",
+        "src.dev.integration.regionalization.ocr_detector",
+    )
+    from datetime import datetime
+    from src.dev.integration.client import NeuroClient
+    from src.dev.integration.regionalization.ocr_detector import OCRElement
+    from src.types.neuro_types import BoundingBox, RegionType, ScreenRegion, SystemState
+
+    windows = [
+        ScreenRegion(
+            id=f"window_{i}", region_type=RegionType.WINDOW,
+            bounds=BoundingBox(x=100 * i, y=0, width=200, height=100), confidence=1.0,
+            title=f"Window {i}", application="app.exe", metadata={"focused": i == 0},
+        )
+        for i in range(3)
+    ]
+    state = SystemState(
+        active_application="app.exe", focused_region=windows[0], all_regions=windows,
+        context_data=[], available_actions=[], timestamp=datetime.now(),
+    )
+    ocr = [
+        OCRElement(text="OK", bbox=(0, 0, 20, 10), confidence=0.9, center_x=10, center_y=5, element_type="button"),
+        OCRElement(text="Hello", bbox=(0, 20, 40, 10), confidence=0.9, center_x=20, center_y=25),
+        OCRElement(text="World", bbox=(0, 40, 40, 10), confidence=0.9, center_x=20, center_y=45),
+    ]
+
+    client = NeuroClient(websocket=None)
+    client._reg = _PaginationSource(state, ocr)
+
+    text = client._get_more_text({"offset": 1, "limit": 1})
+    assert text.splitlines() == [
+        "Detected text items 2-2 of 3 (filter: all):",
+        '  - [text] "Hello" at (20, 25)',
+        "  ... and 1 more (use offset=2)",
+    ]
+    assert client._get_more_text({"filter_type": "buttons"}).splitlines()[1:] == ['  - [button] "OK" at (10, 5)']
+    assert client._get_more_text({"offset": 5}) == "No text items at offset 5 (filter: all, total: 3)"
+
+    page = client._get_more_windows({"offset": 0, "limit": 2})
+    assert page.startswith("Visible Windows 1-2 of 3:\n  1. Window 0 [FOCUSED]\n")
+    assert "  2. Window 1\n     Position: (100, 0), Size: 200x100, Click center: (200, 50)" in page
+    assert page.endswith("  ... and 1 more windows (use offset=2)")
+
+    data = json.loads(client._get_more_windows({"offset": 2, "format": "json"}))
+    assert data["total"] == 3 and data["offset"] == 2
+    assert data["windows"] == [{
+        "title": "Window 2", "x": 200, "y": 0, "w": 200, "h": 100,
+        "cx": 300, "cy": 50, "focused": False, "app": "app.exe",
+    }]
+    print("OK: get_more_text / get_more_windows paginate the cached context.")
+
+# 3) Test Dashboard Flask routes with test client
+@pytest.fixture
+def dashboard_configs(dashboard_client, tmp_path, monkeypatch):
+    """Point the dashboard's config manager at a scratch config and backup dir"""
+    from src.admin.dashboard import config_manager
+    path = tmp_path / "windows_api.yaml"
+    path.write_text("port: 8000\npause: 0.1\n")
+    monkeypatch.setattr(config_manager, "configs", {
+        "windows_api": {"path": path, "name": "Windows-API Authentication"},
+    })
+    monkeypatch.setattr(config_manager, "backup_dir", tmp_path / "backups")
+    monkeypatch.setattr(config_manager, "_config_cache", {})
+    monkeypatch.setattr(config_manager, "_backups_cache", None)
+    (tmp_path / "backups").mkdir()
+    return path
+
+def test_dashboard_routes(dashboard_client, dashboard_configs):
+    client = dashboard_client
+
+    resp = client.get('/')
+    assert resp.status_code == 200
+    assert b"Windows-API Authentication" in resp.data
+
+    resp = client.get('/api/config/windows_api')
+    assert resp.status_code == 200
+    assert resp.json == {"port": 8000, "pause": 0.1}
+    # Handed out as a copy, so the cached parse isn't edited through the response
+    assert client.get('/api/config/windows_api').json == {"port": 8000, "pause": 0.1}
+
+    resp = client.get('/api/backups')
+    assert resp.status_code == 200
+    assert resp.json == []
+
+    # Invalid data is rejected without touching the file or making a backup
+    resp = client.post('/api/config/windows_api', json={"port": "8000"})
+    assert resp.status_code == 400
+    assert "port must be an integer" in resp.json["error"]
+    assert client.get('/api/backups').json == []
+
+    # Saving backs up the old file and the next read sees the new contents, not the cached parse
+    resp = client.post('/api/config/windows_api', json={"port": 9000, "pause": 0.5})
+    assert resp.status_code == 200
+    assert resp.json["success"] is True
+    assert client.get('/api/config/windows_api').json == {"port": 9000, "pause": 0.5}
+
+    backups = client.get('/api/backups').json
+    assert [b["filename"].startswith("windows_api_") for b in backups] == [True]
+    assert Path(backups[0]["path"]).read_text() == "port: 8000\npause: 0.1\n"
+
+    # An edit made outside the dashboard is picked up too
+    dashboard_configs.write_text("port: 7000\n")
+    assert client.get('/api/config/windows_api').json == {"port": 7000}
+
+    resp = client.get('/api/config/missing')
+    assert resp.status_code == 400
+    assert "error" in resp.json
+
+# 4) Test pagination action schemas
+def test_pagination_schemas():
+    require(
+        "neuro_api.command",
+        "pyautogui",  # imported by the Actions package (screen size in the click/move schemas)
+        "src.dev.integration.Actions.get_more_text",
+        "src.dev.integration.Actions.get_more_windows",
+        "src.dev.integration.Actions.refresh_context",
+    )
+    from src.dev.integration.Actions.get_more_text import schema as get_more_text_schema
+    from src.dev.integration.Actions.get_more_windows import schema as get_more_windows_schema
+    from src.dev.integration.Actions.refresh_context import schema as refresh_context_schema
+    from neuro_api.command import Action
+    
+    actions = [
+        get_more_text_schema(),
+        get_more_windows_schema(),
+        refresh_context_schema()
+    ]
+    
+    for action in actions:
+        assert isinstance(action, Action)
+        assert action.name
+        assert action.description
+        assert isinstance(action.schema, dict)
+        assert action.schema.get('type') == 'object'
+        assert 'properties' in action.schema
+        print(f"- Action '{action.name}': OK ({len(action.schema['properties'])} properties)")
+    
+    print("OK: All pagination actions have valid schemas.")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,52 @@
+"""
+Tests for the Neuro-OS debugging tracer
+"""
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from _fixtures import require
+
+@pytest.fixture
+def tracer(tmp_path):
+    require("nakuritycore", "src.dev.utils.tracer")
+    from nakuritycore.data.config import TracerConfig
+    from src.dev.utils.tracer import Tracer
+    tracer = Tracer(TracerConfig(
+        project_root=Path(__file__).parents[2].resolve(),
+        include_paths=["src/tests/test_tracer.py"],
+        use_color=False,
+        events={"call", "return", "exception"},
+        log_dir=tmp_path,
+    ))
+    yield tracer
+    tracer.uninstall()
+
+async def sleeper():
+    await asyncio.sleep(10)
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="sys.monitoring is Python 3.12+")
+async def test_monitoring_survives_task_cancellation(tracer, capsys):
+    tracer.install()
+    assert tracer._monitoring
+
+    # Cancelling throws into both the project coroutine and asyncio.sleep, which is outside the project
+    task = asyncio.create_task(sleeper())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # So does a wait_for timeout
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(sleeper(), timeout=0.01)
+
+    tracer.uninstall()
+    assert "sleeper()" in capsys.readouterr().out
+    log, = tracer.log_path.parent.glob("*.log")
+    assert "sleeper()" in log.read_text()
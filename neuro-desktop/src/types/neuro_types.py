@@ -3,14 +3,19 @@ Type definitions for Neuro-OS integration system
 Defines all data structures for regionalization, context, and plugin architecture
 """
 
+import sys
+import time
+import asyncio
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum, auto
+from enum import Enum, auto, unique
 from typing import Any, Dict, List, Optional, Protocol, Union, Callable
 from abc import ABC, abstractmethod
 
 # === Core Enums ===
 
+@unique
 class RegionType(Enum):
     """Types of screen regions"""
     WINDOW = "window"
@@ -34,6 +39,7 @@ class RegionType(Enum):
     NOTIFICATION = "notification"
     UNKNOWN = "unknown"
 
+@unique
 class ContextType(Enum):
     """Types of context data"""
     VISUAL = "visual"
@@ -43,6 +49,7 @@ class ContextType(Enum):
     TEMPORAL = "temporal"
     SYSTEM_STATE = "system_state"
 
+@unique
 class Priority(Enum):
     """Priority levels for context and actions"""
     CRITICAL = "critical"
@@ -50,6 +57,14 @@ class Priority(Enum):
     MEDIUM = "medium"
     LOW = "low"
 
+    @property
+    def rank(self) -> int:
+        """Int sort key, most urgent first: sorted(contexts, key=lambda c: c.priority.rank)"""
+        return _PRIORITY_RANK[self]
+
+_PRIORITY_RANK = {Priority.CRITICAL: 0, Priority.HIGH: 1, Priority.MEDIUM: 2, Priority.LOW: 3}
+
+@unique
 class PluginType(Enum):
     """Types of plugins in the system"""
     REGION_DETECTOR = "region_detector"
@@ -57,9 +72,33 @@ class PluginType(Enum):
     ACTION_HANDLER = "action_handler"
     APP_INTEGRATION = "app_integration"
 
+    @property
+    def rank(self) -> int:
+        """Int sort key in declaration order: sorted(metadata, key=lambda m: m.plugin_type.rank)"""
+        return _PLUGIN_TYPE_RANK[self]
+
+_PLUGIN_TYPE_RANK = {plugin_type: rank for rank, plugin_type in enumerate(PluginType)}
+
+# Region type groups for filters: `region.region_type in CLICKABLE_REGION_TYPES` is one hash lookup
+CLICKABLE_REGION_TYPES = frozenset({
+    RegionType.BUTTON, RegionType.LINK, RegionType.CHECKBOX, RegionType.RADIO_BUTTON,
+    RegionType.DROPDOWN, RegionType.TAB, RegionType.MENU, RegionType.ICON, RegionType.LIST_ITEM,
+})
+TEXT_INPUT_REGION_TYPES = frozenset({RegionType.INPUT_FIELD, RegionType.TEXT_AREA})
+
+# Enum -> value string, read from a dict instead of the enum's value descriptor in summary loops
+_REGION_TYPE_VALUE = {rt: rt.value for rt in RegionType}
+# Small-int codes for RegionType, as stored in RegionArray.region_types
+REGION_TYPES = tuple(RegionType)
+_REGION_TYPE_CODE = {rt: code for code, rt in enumerate(REGION_TYPES)}
+_CONTEXT_TYPE_VALUE = {ct: ct.value for ct in ContextType}
+
 # === Core Data Structures ===
+# Built for every window/region on every tick: __slots__ keeps them small and their attributes fast.
+# Validation runs under __debug__ only, so `python -O` constructs them without the checks.
+# Coordinates and BoundingBox are frozen value types, hashable for use as dict/set keys.
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Coordinates:
     """Screen coordinates"""
     x: int
@@ -67,10 +106,11 @@ class Coordinates:
 
     def __post_init__(self):
         """Validate coordinates - allow negative for multi-monitor setups"""
-        if not isinstance(self.x, int) or not isinstance(self.y, int):
-            raise ValueError("Coordinates must be integers")
+        if __debug__:
+            if not isinstance(self.x, int) or not isinstance(self.y, int):
+                raise ValueError("Coordinates must be integers")
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
     """Rectangular bounding box with validation"""
     x: int
@@ -80,10 +120,23 @@ class BoundingBox:
 
     def __post_init__(self):
         """Validate bounding box"""
-        if not all(isinstance(val, int) for val in [self.x, self.y, self.width, self.height]):
-            raise ValueError("All bounding box values must be integers")
-        if self.width <= 0 or self.height <= 0:
-            raise ValueError("Width and height must be positive")
+        if __debug__:
+            if not all(isinstance(val, int) for val in [self.x, self.y, self.width, self.height]):
+                raise ValueError("All bounding box values must be integers")
+            if self.width <= 0 or self.height <= 0:
+                raise ValueError("Width and height must be positive")
+
+    @classmethod
+    def unchecked(cls, x: int, y: int, width: int, height: int) -> 'BoundingBox':
+        """Build a box from values the caller already knows are valid (e.g. filtered window rects),
+        skipping __init__ and validation"""
+        box = object.__new__(cls)
+        set_x, set_y, set_width, set_height = _BOX_SLOT_SETTERS
+        set_x(box, x)
+        set_y(box, y)
+        set_width(box, width)
+        set_height(box, height)
+        return box
 
     @property
     def center(self) -> Coordinates:
@@ -107,29 +160,76 @@ class BoundingBox:
                    self.y + self.height < other.y or 
                    other.y + other.height < self.y)
 
-@dataclass
+# Slot descriptors' own setters: the frozen __setattr__ refuses writes, these don't
+_BOX_SLOT_SETTERS = (BoundingBox.x.__set__, BoundingBox.y.__set__,
+                     BoundingBox.width.__set__, BoundingBox.height.__set__)
+
+def _flag_property(bit: int, doc: str) -> property:
+    """Boolean view of one bit of ScreenRegion.flags"""
+    def get(self) -> bool:
+        return bool(self.flags & bit)
+    def set(self, value: bool):
+        self.flags = self.flags | bit if value else self.flags & ~bit
+    return property(get, set, doc=doc)
+
+@dataclass(slots=True, eq=False, init=False)
 class ScreenRegion:
-    """Represents a region on the screen"""
+    """Represents a region on the screen; regions compare and hash by id alone"""
+    # Bits of the packed per-region flags (RegionArray.flags)
+    CLICKABLE = 1
+    FOCUSABLE = 2
+    VISIBLE = 4
+    ENABLED = 8
+
     id: str
     region_type: RegionType
     bounds: BoundingBox
     confidence: float
     title: Optional[str] = None
     application: Optional[str] = None
-    clickable: bool = False
-    focusable: bool = False
-    visible: bool = True
-    enabled: bool = True
+    flags: int = VISIBLE | ENABLED
     parent_id: Optional[str] = None
     children_ids: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
-    def __post_init__(self):
-        """Validate screen region"""
-        if not 0 <= self.confidence <= 1:
-            raise ValueError("Confidence must be between 0 and 1")
+    clickable = _flag_property(CLICKABLE, "Region accepts clicks")
+    focusable = _flag_property(FOCUSABLE, "Region can take keyboard focus")
+    visible = _flag_property(VISIBLE, "Region is shown on screen")
+    enabled = _flag_property(ENABLED, "Region accepts input")
+    
+    def __init__(self, id: str, region_type: RegionType, bounds: BoundingBox, confidence: float,
+                 title: Optional[str] = None, application: Optional[str] = None,
+                 clickable: bool = False, focusable: bool = False, visible: bool = True, enabled: bool = True,
+                 parent_id: Optional[str] = None, children_ids: Optional[List[str]] = None,
+                 metadata: Optional[Dict[str, Any]] = None, flags: Optional[int] = None):
+        """Accepts either packed flags or the individual clickable/focusable/visible/enabled keywords"""
+        if __debug__:
+            if not 0 <= confidence <= 1:
+                raise ValueError("Confidence must be between 0 and 1")
+        self.id = id
+        self.region_type = region_type
+        self.bounds = bounds
+        self.confidence = confidence
+        self.title = title
+        # Application names come from a small vocabulary but arrive as fresh strings every
+        # frame; interning shares one copy and makes the dict/set lookups on them pointer compares
+        self.application = application if application is None else sys.intern(application)
+        if flags is None:
+            flags = clickable | focusable << 1 | visible << 2 | enabled << 3
+        self.flags = flags
+        self.parent_id = parent_id
+        self.children_ids = [] if children_ids is None else children_ids
+        self.metadata = {} if metadata is None else metadata
 
-@dataclass
+    def __eq__(self, other):
+        if not isinstance(other, ScreenRegion):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+@dataclass(slots=True)
 class ContextData:
     """Context information extracted from the system"""
     context_type: ContextType
@@ -139,13 +239,26 @@ class ContextData:
     source: str
     priority: Priority = Priority.MEDIUM
     expires_at: Optional[datetime] = None
+    # Monotonic clock (time.monotonic_ns) twins of timestamp/expires_at for cheap ordering and expiry checks
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+    expires_at_ns: Optional[int] = None
     
     def __post_init__(self):
         """Validate context data"""
-        if not 0 <= self.confidence <= 1:
-            raise ValueError("Confidence must be between 0 and 1")
+        if __debug__:
+            if not 0 <= self.confidence <= 1:
+                raise ValueError("Confidence must be between 0 and 1")
+        self.source = sys.intern(self.source)
 
-@dataclass
+    def expired(self, now_ns: Optional[int] = None) -> bool:
+        """Whether this context has expired; pass now_ns (time.monotonic_ns()) to check many at once"""
+        if self.expires_at_ns is not None:
+            return (time.monotonic_ns() if now_ns is None else now_ns) >= self.expires_at_ns
+        if self.expires_at is not None:
+            return datetime.now() >= self.expires_at
+        return False
+
+@dataclass(slots=True)
 class NeuroAction:
     """Action that can be performed by Neuro"""
     name: str
@@ -158,10 +271,113 @@ class NeuroAction:
     
     def __post_init__(self):
         """Validate action"""
-        if self.estimated_duration < 0:
-            raise ValueError("Estimated duration cannot be negative")
+        if __debug__:
+            if self.estimated_duration < 0:
+                raise ValueError("Estimated duration cannot be negative")
+
+class RegionArray:
+    """Structure-of-arrays (columnar) copy of a region list for batch queries
 
-@dataclass
+    x/y/width/height of every region sit in parallel int32 arrays, so a hit or
+    overlap test over all regions is four vectorized comparisons instead of a
+    Python call per region. Same edge rules as BoundingBox.contains/overlaps.
+    Region types (REGION_TYPES codes) and the four boolean attributes
+    (ScreenRegion.CLICKABLE etc. bits) get a column each as well, so counting
+    and filtering run over contiguous arrays; the region list is kept for detail.
+    """
+    __slots__ = ("regions", "ids", "xs", "ys", "ws", "hs", "region_types", "flags")
+
+    def __init__(self, regions: List[ScreenRegion]):
+        import numpy as np  # only loaded once something asks for batch queries
+
+        self.regions = regions
+        columns = np.array(
+            [(r.bounds.x, r.bounds.y, r.bounds.width, r.bounds.height) for r in regions],
+            dtype=np.int32
+        ).reshape(-1, 4).T.copy()  # one contiguous row per field
+        self.xs, self.ys, self.ws, self.hs = columns
+        count = len(regions)
+        self.ids = np.array([r.id for r in regions], dtype=object)
+        codes = _REGION_TYPE_CODE
+        self.region_types = np.fromiter((codes[r.region_type] for r in regions), dtype=np.int8, count=count)
+        self.flags = np.fromiter(
+            (r.flags for r in regions),
+            dtype=np.uint8, count=count
+        )
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def overlaps_all(self, qx: int, qy: int, qw: int, qh: int):
+        """Boolean mask of regions overlapping the box (qx, qy, qw, qh)"""
+        xs, ys = self.xs, self.ys
+        return ~((xs + self.ws < qx) | (qx + qw < xs) | (ys + self.hs < qy) | (qy + qh < ys))
+
+    def hit_test(self, point: Coordinates):
+        """Boolean mask of regions containing the point"""
+        px, py = point.x, point.y
+        xs, ys = self.xs, self.ys
+        return (xs <= px) & (px <= xs + self.ws) & (ys <= py) & (py <= ys + self.hs)
+
+    def count_by_type(self) -> Dict[RegionType, int]:
+        """Number of regions per region type present, in RegionType order"""
+        import numpy as np
+        counts = np.bincount(self.region_types, minlength=len(REGION_TYPES))
+        return {REGION_TYPES[code]: int(n) for code, n in enumerate(counts) if n}
+
+    def of_type(self, region_type: RegionType):
+        """Boolean mask of regions of the type"""
+        return self.region_types == _REGION_TYPE_CODE[region_type]
+
+    def with_flags(self, bits: int):
+        """Boolean mask of regions with all of the flag bits set, e.g. ScreenRegion.CLICKABLE | ScreenRegion.VISIBLE"""
+        return (self.flags & bits) == bits
+
+    def select(self, mask) -> List[ScreenRegion]:
+        """Regions where mask is set, in region order"""
+        regions = self.regions
+        return [regions[i] for i in mask.nonzero()[0]]
+
+class RegionGrid:
+    """Spatial hash of region bounds for point and box lookups
+
+    Each region is listed under every cell its bounds touch, so a query only
+    checks the regions sharing its cells before the exact BoundingBox test.
+    """
+    __slots__ = ("regions", "cell", "cells")
+
+    def __init__(self, regions: List[ScreenRegion], cell: int = 256):
+        self.regions = regions
+        self.cell = cell
+        cells: Dict[tuple, List[int]] = {}
+        for i, region in enumerate(regions):
+            b = region.bounds
+            # Edges are inclusive (BoundingBox.contains), so x + width belongs to the box too
+            for cx in range(b.x // cell, (b.x + b.width) // cell + 1):
+                for cy in range(b.y // cell, (b.y + b.height) // cell + 1):
+                    cells.setdefault((cx, cy), []).append(i)
+        self.cells = cells
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def at(self, point: Coordinates) -> List[ScreenRegion]:
+        """Regions containing the point, in region order"""
+        regions = self.regions
+        candidates = self.cells.get((point.x // self.cell, point.y // self.cell), ())
+        return [regions[i] for i in candidates if regions[i].bounds.contains(point)]
+
+    def overlapping(self, box: BoundingBox) -> List[ScreenRegion]:
+        """Regions overlapping the box, in region order"""
+        cell, cells = self.cell, self.cells
+        candidates = set()
+        for cx in range(box.x // cell, (box.x + box.width) // cell + 1):
+            for cy in range(box.y // cell, (box.y + box.height) // cell + 1):
+                candidates.update(cells.get((cx, cy), ()))
+        regions = self.regions
+        return [regions[i] for i in sorted(candidates) if regions[i].bounds.overlaps(box)]
+
+@dataclass(slots=True)
 class SystemState:
     """Current state of the system"""
     active_application: Optional[str]
@@ -172,6 +388,39 @@ class SystemState:
     timestamp: datetime
     screen_resolution: Optional[Coordinates] = None
     mouse_position: Optional[Coordinates] = None
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)  # monotonic twin of timestamp
+    _region_array: Optional[RegionArray] = field(default=None, init=False, repr=False, compare=False)
+    _region_grid: Optional[RegionGrid] = field(default=None, init=False, repr=False, compare=False)
+
+    def region_array(self) -> RegionArray:
+        """SoA copy of all_regions, rebuilt when the list is replaced or changes length
+
+        Editing regions in place without changing the count (or swapping one region
+        for another) isn't detected; call invalidate_regions() afterwards.
+        """
+        array = self._region_array
+        if array is None or array.regions is not self.all_regions or len(array) != len(self.all_regions):
+            array = self._region_array = RegionArray(self.all_regions)
+        return array
+
+    def _grid(self) -> RegionGrid:
+        grid = self._region_grid
+        if grid is None or grid.regions is not self.all_regions or len(grid) != len(self.all_regions):
+            grid = self._region_grid = RegionGrid(self.all_regions)
+        return grid
+
+    def invalidate_regions(self):
+        """Drop the batch-query caches after all_regions was edited in place"""
+        self._region_array = None
+        self._region_grid = None
+
+    def regions_at(self, point: Coordinates) -> List[ScreenRegion]:
+        """Regions containing the point, through a spatial hash built on first use"""
+        return self._grid().at(point)
+
+    def regions_overlapping(self, box: BoundingBox) -> List[ScreenRegion]:
+        """Regions overlapping the box, through a spatial hash built on first use"""
+        return self._grid().overlapping(box)
 
 # === Plugin Architecture ===
 
@@ -223,7 +472,7 @@ class AppIntegrationProtocol(Protocol):
         """Get supported applications"""
         ...
 
-@dataclass
+@dataclass(slots=True)
 class PluginMetadata:
     """Metadata for plugins"""
     name: str
@@ -234,6 +483,18 @@ class PluginMetadata:
     supported_apps: List[str] = field(default_factory=list)
     dependencies: List[str] = field(default_factory=list)
     enabled: bool = True
+    
+    def __post_init__(self):
+        """Intern app names; they key PluginRegistry's per-app index and are matched against ScreenRegion.application"""
+        self.supported_apps = [sys.intern(app) for app in self.supported_apps]
+
+# Method each plugin type is dispatched through (see the protocols above)
+PLUGIN_ENTRY_POINTS = {
+    PluginType.REGION_DETECTOR: "detect_regions",
+    PluginType.CONTEXT_PROVIDER: "extract_context",
+    PluginType.ACTION_HANDLER: "execute_action",
+    PluginType.APP_INTEGRATION: "get_app_context",
+}
 
 class PluginRegistry:
     """Registry for managing plugins"""
@@ -241,25 +502,100 @@ class PluginRegistry:
     def __init__(self):
         self.plugins: Dict[str, Any] = {}
         self.metadata: Dict[str, PluginMetadata] = {}
+        # Inverted indexes of plugin names, so lookups don't scan every plugin
+        self._by_type: Dict[PluginType, List[str]] = {}
+        self._by_app: Dict[str, List[str]] = {}
+        # Plugins registered lazily and not built yet, by name
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        # Per type: (metadata, bound entry point) of every plugin, rebuilt after (un)registration
+        self._dispatch: Dict[PluginType, List[tuple]] = {}
     
     def register_plugin(self, plugin: Any, metadata: PluginMetadata):
         """Register a plugin"""
+        self._add(metadata)
         self.plugins[metadata.name] = plugin
-        self.metadata[metadata.name] = metadata
+    
+    def register_lazy(self, metadata: PluginMetadata, factory: Callable[[], Any]):
+        """Register a plugin by metadata only; factory() builds it the first time a lookup returns it"""
+        self._add(metadata)
+        self._factories[metadata.name] = factory
+    
+    async def preload_all(self):
+        """Build every lazily registered plugin now, in worker threads (e.g. at app startup)"""
+        pending = list(self._factories.items())
+        built = await asyncio.gather(*(asyncio.to_thread(factory) for _, factory in pending))
+        for (name, factory), plugin in zip(pending, built):
+            if self._factories.get(name) is factory:  # not re-registered meanwhile
+                del self._factories[name]
+                self.plugins[name] = plugin
+    
+    def _add(self, metadata: PluginMetadata):
+        name = metadata.name
+        if name in self.metadata:
+            self._unindex(self.metadata[name])
+        self.plugins.pop(name, None)
+        self._factories.pop(name, None)
+        self.metadata[name] = metadata
+        self._dispatch.pop(metadata.plugin_type, None)
+        self._by_type.setdefault(metadata.plugin_type, []).append(name)
+        for app in metadata.supported_apps:
+            self._by_app.setdefault(app, []).append(name)
+    
+    def unregister_plugin(self, name: str):
+        """Remove a plugin; unknown names are ignored"""
+        metadata = self.metadata.pop(name, None)
+        if metadata is None:
+            return
+        self.plugins.pop(name, None)
+        self._factories.pop(name, None)
+        self._unindex(metadata)
+    
+    def _unindex(self, metadata: PluginMetadata):
+        self._dispatch.pop(metadata.plugin_type, None)
+        name = metadata.name
+        # Emptied entries are dropped, so the indexes only ever name registered plugins
+        for index, key in ((self._by_type, metadata.plugin_type),
+                           *((self._by_app, app) for app in metadata.supported_apps)):
+            names = index[key]
+            names.remove(name)
+            if not names:
+                del index[key]
+    
+    def _plugin(self, name: str) -> Any:
+        try:
+            return self.plugins[name]
+        except KeyError:
+            plugin = self.plugins[name] = self._factories.pop(name)()
+            return plugin
+    
+    def _enabled(self, names: List[str]) -> List[Any]:
+        # enabled can be toggled on the metadata after registration, so it is checked per call
+        metadata = self.metadata
+        return [self._plugin(name) for name in names if metadata[name].enabled]
     
     def get_plugins_by_type(self, plugin_type: PluginType) -> List[Any]:
         """Get all plugins of a specific type"""
-        return [
-            plugin for name, plugin in self.plugins.items()
-            if self.metadata[name].plugin_type == plugin_type and self.metadata[name].enabled
-        ]
+        return self._enabled(self._by_type.get(plugin_type, ()))
     
     def get_plugins_for_app(self, app_name: str) -> List[Any]:
         """Get all plugins that support a specific application"""
-        return [
-            plugin for name, plugin in self.plugins.items()
-            if app_name in self.metadata[name].supported_apps and self.metadata[name].enabled
-        ]
+        return self._enabled(self._by_app.get(app_name, ()))
+    
+    def get_handlers(self, plugin_type: PluginType) -> List[Callable]:
+        """Bound entry points (PLUGIN_ENTRY_POINTS) of the enabled plugins of a type
+        
+        Callers dispatch with `for handler in registry.get_handlers(...): await handler(...)`
+        instead of looking the method up (or isinstance-checking a Protocol) per plugin per call.
+        The first call for a type builds all of that type's lazily registered plugins.
+        """
+        table = self._dispatch.get(plugin_type)
+        if table is None:
+            method, metadata = PLUGIN_ENTRY_POINTS[plugin_type], self.metadata
+            table = self._dispatch[plugin_type] = [
+                (metadata[name], getattr(self._plugin(name), method))
+                for name in self._by_type.get(plugin_type, ())
+            ]
+        return [handler for metadata, handler in table if metadata.enabled]
 
 # === Message Building ===
 
@@ -268,6 +604,8 @@ class NeuroMessageBuilder:
     
     def __init__(self):
         self.current_state: Optional[SystemState] = None
+        # (state, region lines, action/context lines) for the last state the sections were built from
+        self._sections_cache: Optional[tuple] = None
     
     def update_state(self, state: SystemState):
         """Update the current system state"""
@@ -367,33 +705,48 @@ class NeuroMessageBuilder:
             # OCR failed - may not have tesseract installed
             sections.append(f"\n[OCR unavailable - install tesseract for text detection]")
         
+        region_sections, summary_sections = self._state_sections(state)
+        sections += region_sections
+        
+        # OCR-detected UI elements
+        if ocr_elements and ocr_detector:
+            sections.append("\n" + ocr_detector.format_for_context(ocr_elements))
+        
+        sections += summary_sections
+        
+        return "\n".join(sections)
+    
+    def _state_sections(self, state: SystemState) -> tuple:
+        """Lines derived only from the state (regions, windows, actions, context), built once per state
+
+        Screen size, mouse position and OCR are live and rebuilt every call; these sections
+        only change when the core publishes a new SystemState, so they are reused until then.
+        """
+        cached = self._sections_cache
+        if cached is not None and cached[0] is state:
+            return cached[1], cached[2]
+        
+        sections = []
+        
         # Region summary
         if state.all_regions:
-            region_types = {}
-            for region in state.all_regions:
-                region_types[region.region_type.value] = region_types.get(region.region_type.value, 0) + 1
+            region_types = Counter(region.region_type for region in state.all_regions)
             
             sections.append(f"Screen Regions ({len(state.all_regions)} total):")
             for region_type, count in region_types.items():
-                sections.append(f"  - {region_type}: {count}")
+                sections.append(f"  - {_REGION_TYPE_VALUE[region_type]}: {count}")
         
         # Focused element with coordinates
         if state.focused_region:
             focused = state.focused_region
             center_x = focused.bounds.x + focused.bounds.width // 2
             center_y = focused.bounds.y + focused.bounds.height // 2
-            sections.append(
-                f"\nFocused Window: {focused.title} ({focused.region_type.value})"
-            )
-            sections.append(
-                f"  Position: ({focused.bounds.x}, {focused.bounds.y})"
-            )
-            sections.append(
-                f"  Size: {focused.bounds.width}x{focused.bounds.height}"
-            )
-            sections.append(
-                f"  Center: ({center_x}, {center_y})"
-            )
+            sections.extend((
+                f"\nFocused Window: {focused.title} ({_REGION_TYPE_VALUE[focused.region_type]})",
+                f"  Position: ({focused.bounds.x}, {focused.bounds.y})",
+                f"  Size: {focused.bounds.width}x{focused.bounds.height}",
+                f"  Center: ({center_x}, {center_y})",
+            ))
             
             # Add details about child regions if any
             child_regions = [r for r in state.all_regions if r.parent_id == focused.id]
@@ -410,7 +763,7 @@ class NeuroMessageBuilder:
                     sections.append(f"    ... and {len(child_regions) - 5} more")
         
         # List all visible windows with coordinates
-        window_regions = [r for r in state.all_regions if r.region_type.value == 'window']
+        window_regions = [r for r in state.all_regions if r.region_type is RegionType.WINDOW]
         if window_regions:
             sections.append(f"\nVisible Windows ({len(window_regions)}):")
             for i, window in enumerate(window_regions[:10]):  # Show first 10
@@ -429,42 +782,34 @@ class NeuroMessageBuilder:
             if len(window_regions) > 10:
                 sections.append(f"  ... and {len(window_regions) - 10} more windows")
         
-        # OCR-detected UI elements
-        if ocr_elements and ocr_detector:
-            sections.append("\n" + ocr_detector.format_for_context(ocr_elements))
+        region_sections = sections
+        sections = []
         
         # Available actions summary
         if state.available_actions:
             sections.append(f"\nAvailable Actions: {len(state.available_actions)} total")
             # Group by action type
-            action_types = {}
-            for action in state.available_actions:
-                action_type = action.name.split('_')[0] if '_' in action.name else action.name
-                action_types[action_type] = action_types.get(action_type, 0) + 1
+            action_types = Counter(action.name.partition('_')[0] for action in state.available_actions)
             for action_type, count in action_types.items():
                 sections.append(f"  - {count} {action_type} actions")
         
         # Context data summary
         if state.context_data:
-            context_types = {}
-            for context in state.context_data:
-                context_types[context.context_type.value] = context_types.get(context.context_type.value, 0) + 1
+            context_types = Counter(context.context_type for context in state.context_data)
             
             sections.append(f"Context Data:")
             for context_type, count in context_types.items():
-                sections.append(f"  - {context_type}: {count} items")
+                sections.append(f"  - {_CONTEXT_TYPE_VALUE[context_type]}: {count} items")
         
-        return "\n".join(sections)
+        self._sections_cache = (state, region_sections, sections)
+        return region_sections, sections
     
     def build_action_response(self, action: NeuroAction, success: bool, details: str = "") -> str:
         """Build a response message after executing an action"""
-        status = "successfully" if success else "failed to"
-        message = f"Action '{action.name}' {status} executed"
-        
+        parts = ["Action '", action.name, "' ", "successfully" if success else "failed to", " executed"]
         if details:
-            message += f": {details}"
-        
-        return message
+            parts += (": ", details)
+        return "".join(parts)
     
     def build_region_info(self, region: ScreenRegion) -> str:
         """Build detailed information about a specific region"""
@@ -497,6 +842,7 @@ class NeuroMessageBuilder:
 __all__ = [
     # Enums
     'RegionType', 'ContextType', 'Priority', 'PluginType',
+    'CLICKABLE_REGION_TYPES', 'TEXT_INPUT_REGION_TYPES',
     
     # Core data structures  
     'Coordinates', 'BoundingBox', 'ScreenRegion', 'ContextData', 
@@ -505,7 +851,10 @@ __all__ = [
     # Plugin architecture
     'RegionDetectorProtocol', 'ContextProviderProtocol', 
     'ActionHandlerProtocol', 'AppIntegrationProtocol',
-    'PluginMetadata', 'PluginRegistry',
+    'PluginMetadata', 'PluginRegistry', 'PLUGIN_ENTRY_POINTS',
+    
+    # Region queries
+    'RegionArray', 'RegionGrid', 'REGION_TYPES',
     
     # Message building
     'NeuroMessageBuilder'